@@ -3,21 +3,99 @@ Care Operations Console Data Models
 DynamoDB access patterns and data models for the care operations system
 """
 
-import json
+import base64
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
+from threading import Lock
 import boto3
+import orjson
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeSerializer
+from cachetools import TTLCache, cached
 from aws_lambda_powertools import Logger
 
+from dynamodb_setup import DEFAULT_QUEUE_PRIORITY, queue_sort_key
+
 logger = Logger()
 
 # AWS Clients
+TABLE_NAME = os.environ.get('DYNAMODB_TABLE', 'CareCircle-Data')
 dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'CareCircle-Data'))
+table = dynamodb.Table(TABLE_NAME)
+
+# Low-level client and a single shared serializer for high-volume writes
+dynamodb_client = boto3.client('dynamodb')
+type_serializer = TypeSerializer()
+
+# Optional DAX cluster for repeat-read lookups (requires amazon-dax-client).
+# DAX's query cache is not updated by writes, so only reads that tolerate a
+# query-cache TTL of lag may use it; read-after-write paths stay on the table.
+DAX_ENDPOINT = os.environ.get('DAX_ENDPOINT')
+
+def _create_read_table():
+    """Use DAX for cached reads when configured, falling back to the table"""
+    if not DAX_ENDPOINT:
+        return table
+    try:
+        import amazondax
+        dax = amazondax.AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT)
+        return dax.Table(TABLE_NAME)
+    except Exception as e:
+        logger.warning(f"DAX unavailable, reading from DynamoDB directly: {e}")
+        return table
+
+read_table = _create_read_table()
+
+# Short-lived cache for dashboard reads, shared across warm invocations.
+# A few seconds of staleness collapses refresh storms from several family members.
+READ_CACHE_TTL_SECONDS = int(os.environ.get('READ_CACHE_TTL_SECONDS', '5'))
+_read_cache = TTLCache(maxsize=1024, ttl=READ_CACHE_TTL_SECONDS)
+_read_cache_lock = Lock()
+
+def _freeze(value: Any) -> Any:
+    """Make dict arguments hashable for use in cache keys"""
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+def _family_cache_key(method_name: str):
+    """Build a cache key function for DAO read methods taking family_id first"""
+    def make_key(self, family_id: str, *args, **kwargs):
+        return (
+            family_id,
+            self.table_name,
+            method_name,
+            tuple(_freeze(arg) for arg in args),
+            tuple(sorted((name, _freeze(arg)) for name, arg in kwargs.items()))
+        )
+    return make_key
+
+def _copy_value(value: Any) -> Any:
+    """Copy the dicts, lists and sets of a DynamoDB item; scalars are shared"""
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+def _copy_items(items: Tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Hand out cached items as fresh copies so callers cannot change the cache"""
+    return [_copy_value(item) for item in items]
+
+def invalidate_family_cache(family_id: str) -> None:
+    """Drop all cached reads for a family after a write"""
+    with _read_cache_lock:
+        for key in [k for k in _read_cache.keys() if k[0] == family_id]:
+            _read_cache.pop(key, None)
 
 # =============================================
 # Enums and Constants
@@ -61,6 +139,41 @@ class QueueItemType(Enum):
     CHECKIN = "checkin"
     FOLLOWUP = "followup"
 
+# Priority scoring weights
+SEVERITY_BASE_SCORES = {
+    AlertSeverity.URGENT: 100,
+    AlertSeverity.HIGH: 75,
+    AlertSeverity.MEDIUM: 50,
+    AlertSeverity.LOW: 25
+}
+SEVERITY_BY_VALUE = {severity.value: severity for severity in AlertSeverity}
+OVERDUE_BONUS = 50
+DUE_TODAY_BONUS = 25
+HIGH_RISK_BONUS = 20
+UNASSIGNED_BONUS = 15
+ESCALATION_BONUS = 10
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# update_task_status expressions keyed by (has assigned_to, has assigned_to_name).
+# Assigning also moves the task's GSI1PK so assignee queries pick it up.
+TASK_STATUS_UPDATE_EXPRESSIONS = {
+    (False, False): 'SET #status = :status, updated_at = :updated',
+    (True, False): 'SET #status = :status, updated_at = :updated, assigned_to = :assigned_to, GSI1PK = :gsi1pk',
+    (False, True): 'SET #status = :status, updated_at = :updated, assigned_to_name = :assigned_to_name',
+    (True, True): 'SET #status = :status, updated_at = :updated, assigned_to = :assigned_to, GSI1PK = :gsi1pk, '
+                  'assigned_to_name = :assigned_to_name',
+}
+
+# Suggested actions for urgent alerts, keyed by (severity, alert type)
+SUGGESTED_ACTIONS = {
+    ('urgent', 'fall'): 'Start Urgent Triage Protocol',
+    ('urgent', 'medication'): 'Verify Medication Status',
+}
+URGENT_DEFAULT_ACTION = 'Take Immediate Action'
+
+# Precomputed review actions for known alert types
+REVIEW_ACTIONS = {alert_type.value: f'Review {alert_type.value.title()} Alert' for alert_type in AlertType}
+
 # =============================================
 # Data Classes
 # =============================================
@@ -92,6 +205,7 @@ class Alert:
             'elder_name': self.elder_name,
             'ai_analysis': self.ai_analysis,
             'created_at': self.created_at,
+            **created_epoch_attribute(self.created_at),
             'status': self.status,
             'assigned_to': self.assigned_to,
             'entity_type': 'alert'
@@ -120,7 +234,7 @@ class Task:
             self.checklist = []
     
     def to_dynamodb_item(self, family_id: str) -> Dict[str, Any]:
-        return {
+        item = {
             'PK': f'FAMILY#{family_id}',
             'SK': self.id,
             'GSI1PK': f'ASSIGNEE#{self.assigned_to}' if self.assigned_to else 'UNASSIGNED',
@@ -134,6 +248,7 @@ class Task:
             'elder_name': self.elder_name,
             'created_by': self.created_by,
             'created_at': self.created_at,
+            **created_epoch_attribute(self.created_at),
             'updated_at': self.updated_at,
             'parent_id': self.parent_id,
             'assigned_to': self.assigned_to,
@@ -144,6 +259,13 @@ class Task:
             'status': self.status.value,
             'entity_type': 'task'
         }
+        
+        # GSI3: Due-date bucket, so "due today" is a single partition read
+        if self.due_at:
+            item['GSI3PK'] = f'DUEDATE#{family_id}#{self.due_at[:10]}'
+            item['GSI3SK'] = self.due_at
+        
+        return item
 
 @dataclass
 class Plan:
@@ -260,13 +382,35 @@ class QueueItem:
     suggested_action: str
     priority: int
     assigned_to: Optional[str] = None
+    elder_risk_level: str = 'medium'
+    escalation_count: int = 0
+    
+    def priority_score(self) -> int:
+        return calculate_priority_score(
+            self.severity,
+            due_at=self.due_at,
+            elder_risk_level=self.elder_risk_level,
+            assignment_status='assigned' if self.assigned_to else 'unassigned',
+            escalation_count=self.escalation_count
+        )
+    
+    def base_priority_score(self) -> int:
+        return calculate_base_priority_score(
+            self.severity,
+            elder_risk_level=self.elder_risk_level,
+            assignment_status='assigned' if self.assigned_to else 'unassigned',
+            escalation_count=self.escalation_count
+        )
     
     def to_dynamodb_item(self, family_id: str) -> Dict[str, Any]:
-        return {
+        # Only the time-independent part of the score is stored and encoded in
+        # GSI1SK; due-time bonuses change with the clock and are applied on read
+        base_priority_score = self.base_priority_score()
+        item = {
             'PK': f'FAMILY#{family_id}',
             'SK': self.id,
             'GSI1PK': f'QUEUE#{family_id}',
-            'GSI1SK': f'{self.priority:03d}#{self.due_at}',
+            'GSI1SK': queue_sort_key(self.priority, base_priority_score, self.due_at),
             'GSI2PK': f'ASSIGNEE#{self.assigned_to}' if self.assigned_to else 'UNASSIGNED',
             'GSI2SK': self.due_at,
             'queue_item_id': self.id,
@@ -279,9 +423,19 @@ class QueueItem:
             'status': self.status.value,
             'suggested_action': self.suggested_action,
             'priority': self.priority,
+            'base_priority_score': base_priority_score,
+            'elder_risk_level': self.elder_risk_level,
+            'escalation_count': self.escalation_count,
             'assigned_to': self.assigned_to,
             'entity_type': 'queue_item'
         }
+        
+        # GSI3: Due-date bucket, so "due today" is a single partition read
+        if self.due_at:
+            item['GSI3PK'] = f'DUEDATE#{family_id}#{self.due_at[:10]}'
+            item['GSI3SK'] = self.due_at
+        
+        return item
 
 # =============================================
 # Data Access Layer
@@ -292,6 +446,32 @@ class CareOperationsDAO:
     
     def __init__(self):
         self.table = table
+        self.read_table = read_table
+        self.client = dynamodb_client
+        self.table_name = TABLE_NAME
+    
+    # =============================================
+    # Bulk Operations
+    # =============================================
+    
+    def bulk_create(self, entities: List[Tuple[Any, str]]) -> List[Dict[str, Any]]:
+        """Create several entities (alert, task, plan, outcome, timeline) in batched writes
+        
+        Takes (entity, family_id) pairs. The batch writer groups puts into
+        BatchWriteItem requests of up to 25 items and retries unprocessed items.
+        """
+        try:
+            items = [entity.to_dynamodb_item(family_id) for entity, family_id in entities]
+            with self.table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+            for family_id in {family_id for _, family_id in entities}:
+                invalidate_family_cache(family_id)
+            logger.info(f"Bulk created {len(items)} items")
+            return items
+        except Exception as e:
+            logger.error(f"Error bulk creating items: {e}")
+            raise
     
     # =============================================
     # Alert Operations
@@ -302,6 +482,7 @@ class CareOperationsDAO:
         try:
             item = alert.to_dynamodb_item(family_id)
             self.table.put_item(Item=item)
+            invalidate_family_cache(family_id)
             logger.info(f"Created alert {alert.id} for family {family_id}")
             return item
         except Exception as e:
@@ -311,30 +492,50 @@ class CareOperationsDAO:
     def get_alerts_by_family(self, family_id: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Get all alerts for a family"""
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key('PK').eq(f'FAMILY#{family_id}') & Key('SK').begins_with('ALERT#'),
-                ScanIndexForward=False,  # Most recent first
-                Limit=limit
-            )
-            return response.get('Items', [])
+            return _copy_items(self._cached_alerts_by_family(family_id, limit))
         except Exception as e:
             logger.error(f"Error getting alerts for family {family_id}: {e}")
             return []
     
-    def get_alerts_by_severity(self, severity: AlertSeverity, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get alerts by severity across all families"""
+    @cached(_read_cache, key=_family_cache_key('alerts_by_family'), lock=_read_cache_lock)
+    def _cached_alerts_by_family(self, family_id: str, limit: int = 20) -> Tuple[Dict[str, Any], ...]:
+        """Cached alert read; raises on failure so errors are never cached"""
+        return tuple(self._query_alerts_by_family(family_id, limit))
+    
+    def _query_alerts_by_family(self, family_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Query a family's most recent alerts, raising on failure"""
+        # Base table, not DAX: the list must show an alert as soon as create_alert returns
+        return self._query_items(
+            KeyConditionExpression=Key('PK').eq(f'FAMILY#{family_id}') & Key('SK').begins_with('ALERT#'),
+            ScanIndexForward=False,  # Most recent first
+            Limit=limit
+        )
+    
+    def get_alerts_by_severity(self, severity: AlertSeverity, limit: int = 50,
+                               family_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get alerts by severity across all families, or for one family if given"""
         try:
-            response = self.table.query(
-                IndexName='GSI2',
-                KeyConditionExpression=Key('GSI2PK').eq(f'SEVERITY#{severity.value}'),
-                ScanIndexForward=False,
-                Limit=limit
-            )
-            return response.get('Items', [])
+            return self._query_alerts_by_severity(severity, limit, family_id)
         except Exception as e:
             logger.error(f"Error getting alerts by severity {severity.value}: {e}")
             return []
     
+    def _query_alerts_by_severity(self, severity: AlertSeverity, limit: int = 50,
+                                  family_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Query alerts by severity, raising on failure"""
+        query_kwargs = {
+            'IndexName': 'GSI2',
+            'KeyConditionExpression': Key('GSI2PK').eq(f'SEVERITY#{severity.value}'),
+            'ScanIndexForward': False,
+            'Limit': limit
+        }
+        
+        if family_id:
+            query_kwargs['FilterExpression'] = Attr('PK').eq(f'FAMILY#{family_id}')
+        
+        # Runs inside get_urgent_items' worker threads, so go through the client
+        return self._query_items(**query_kwargs)
+    
     # =============================================
     # Task Operations
     # =============================================
@@ -344,29 +545,43 @@ class CareOperationsDAO:
         try:
             item = task.to_dynamodb_item(family_id)
             self.table.put_item(Item=item)
+            invalidate_family_cache(family_id)
             logger.info(f"Created task {task.id} for family {family_id}")
             return item
         except Exception as e:
             logger.error(f"Error creating task: {e}")
             raise
     
-    def get_tasks_by_family(self, family_id: str, status_filter: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """Get all tasks for a family with optional status filter"""
+    def iter_tasks_by_family(self, family_id: str, status_filter: Optional[List[str]] = None,
+                             page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """Lazily yield a family's tasks page by page, filtering by status server-side"""
+        query_kwargs = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': Key('PK').eq(f'FAMILY#{family_id}') & Key('SK').begins_with('TASK#'),
+            'PaginationConfig': {'PageSize': page_size}
+        }
+        
+        if status_filter:
+            query_kwargs['FilterExpression'] = Attr('status').is_in(status_filter)
+        
+        paginator = self.table.meta.client.get_paginator('query')
+        for page in paginator.paginate(**query_kwargs):
+            yield from page.get('Items', [])
+    
+    def get_tasks_by_family(self, family_id: str, status_filter: Optional[List[str]] = None,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get tasks for a family with optional status filter, stopping after `limit` matches"""
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key('PK').eq(f'FAMILY#{family_id}') & Key('SK').begins_with('TASK#')
-            )
-            
-            tasks = response.get('Items', [])
-            
-            if status_filter:
-                tasks = [t for t in tasks if t.get('status') in status_filter]
-            
-            return tasks
+            return self._query_tasks_by_family(family_id, status_filter, limit)
         except Exception as e:
             logger.error(f"Error getting tasks for family {family_id}: {e}")
             return []
     
+    def _query_tasks_by_family(self, family_id: str, status_filter: Optional[List[str]] = None,
+                               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Collect a family's tasks, raising on failure"""
+        return list(islice(self.iter_tasks_by_family(family_id, status_filter), limit))
+    
     def get_tasks_by_assignee(self, assignee_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get tasks assigned to a specific user"""
         try:
@@ -385,32 +600,26 @@ class CareOperationsDAO:
                           assigned_to: Optional[str] = None, assigned_to_name: Optional[str] = None) -> Dict[str, Any]:
         """Update task status and assignment"""
         try:
-            update_expression = 'SET #status = :status, updated_at = :updated'
             expression_values = {
                 ':status': status.value,
-                ':updated': datetime.utcnow().isoformat() + 'Z'
+                ':updated': utc_now_iso()
             }
-            expression_names = {'#status': 'status'}
             
             if assigned_to:
-                update_expression += ', assigned_to = :assigned_to'
                 expression_values[':assigned_to'] = assigned_to
-                
-                # Update GSI1PK for assignment queries
-                update_expression += ', GSI1PK = :gsi1pk'
                 expression_values[':gsi1pk'] = f'ASSIGNEE#{assigned_to}'
             
             if assigned_to_name:
-                update_expression += ', assigned_to_name = :assigned_to_name'
                 expression_values[':assigned_to_name'] = assigned_to_name
             
             response = self.table.update_item(
                 Key={'PK': f'FAMILY#{family_id}', 'SK': task_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expression_names,
+                UpdateExpression=TASK_STATUS_UPDATE_EXPRESSIONS[(bool(assigned_to), bool(assigned_to_name))],
+                ExpressionAttributeNames={'#status': 'status'},
                 ExpressionAttributeValues=expression_values,
                 ReturnValues='ALL_NEW'
             )
+            invalidate_family_cache(family_id)
             
             return response.get('Attributes', {})
         except Exception as e:
@@ -424,89 +633,224 @@ class CareOperationsDAO:
     def get_care_queue(self, family_id: str, filters: Optional[Dict[str, bool]] = None) -> List[Dict[str, Any]]:
         """Get unified care queue for a family"""
         try:
-            response = self.table.query(
+            return _copy_items(self._cached_care_queue(family_id, filters))
+        except Exception as e:
+            logger.error(f"Error getting care queue for family {family_id}: {e}")
+            return []
+    
+    @cached(_read_cache, key=_family_cache_key('care_queue'), lock=_read_cache_lock)
+    def _cached_care_queue(self, family_id: str, filters: Optional[Dict[str, bool]] = None) -> Tuple[Dict[str, Any], ...]:
+        """Cached care queue read; raises on failure so errors are never cached"""
+        return tuple(self._query_care_queue(family_id, filters))
+    
+    def _query_care_queue(self, family_id: str, filters: Optional[Dict[str, bool]] = None) -> List[Dict[str, Any]]:
+        """Query and filter a family's care queue, raising on failure"""
+        if filters and filters.get('dueToday'):
+            # Read only today's due-date bucket; ranking below restores queue order
+            queue_items = self._query_due_today(family_id, entity_type='queue_item')
+        else:
+            queue_items = self._query_items(
                 IndexName='GSI1',
                 KeyConditionExpression=Key('GSI1PK').eq(f'QUEUE#{family_id}'),
-                ScanIndexForward=True  # Priority ascending (urgent first)
+                ScanIndexForward=True  # Lowest priority, then highest base score first
             )
+        
+        # GSI1 order only knows the base scores; add the current due-time bonuses
+        queue_items = rank_queue_items(queue_items)
+        
+        # Apply filters if provided
+        if filters:
+            filtered_items = []
+            for item in queue_items:
+                if filters.get('urgent') and item.get('severity') != 'urgent':
+                    continue
+                if filters.get('assignedToMe'):
+                    # This would need the current user ID passed in
+                    pass
+                if filters.get('medication') and item.get('type') != 'medication':
+                    continue
+                if filters.get('cognitive') and 'cognitive' not in item.get('title', '').lower():
+                    continue
+                if filters.get('safety') and 'safety' not in item.get('title', '').lower():
+                    continue
+                
+                filtered_items.append(item)
             
-            queue_items = response.get('Items', [])
+            return filtered_items
+        
+        return queue_items
+    
+    def escalate_queue_item(self, family_id: str, queue_item_id: str) -> Dict[str, Any]:
+        """Bump a queue item's escalation count and re-rank it in the queue"""
+        try:
+            key = {'PK': f'FAMILY#{family_id}', 'SK': queue_item_id}
+            item = self.table.get_item(Key=key).get('Item')
+            if not item:
+                raise ValueError(f"Queue item {queue_item_id} not found")
             
-            # Apply filters if provided
-            if filters:
-                filtered_items = []
-                for item in queue_items:
-                    if filters.get('urgent') and item.get('severity') != 'urgent':
-                        continue
-                    if filters.get('dueToday'):
-                        due_date = item.get('due_at', '')
-                        today = datetime.utcnow().date().isoformat()
-                        if not due_date.startswith(today):
-                            continue
-                    if filters.get('assignedToMe'):
-                        # This would need the current user ID passed in
-                        pass
-                    if filters.get('medication') and item.get('type') != 'medication':
-                        continue
-                    if filters.get('cognitive') and 'cognitive' not in item.get('title', '').lower():
-                        continue
-                    if filters.get('safety') and 'safety' not in item.get('title', '').lower():
-                        continue
-                    
-                    filtered_items.append(item)
-                
-                return filtered_items
+            previous_count = int(item.get('escalation_count', 0))
+            item['escalation_count'] = previous_count + 1
+            base_priority_score = base_priority_score_for_item(item)
             
-            return queue_items
+            response = self.table.update_item(
+                Key=key,
+                UpdateExpression='SET escalation_count = :count, base_priority_score = :score, GSI1SK = :gsi1sk '
+                                 'REMOVE priority_score',
+                ConditionExpression='attribute_not_exists(escalation_count) OR escalation_count = :previous',
+                ExpressionAttributeValues={
+                    ':count': previous_count + 1,
+                    ':previous': previous_count,
+                    ':score': base_priority_score,
+                    ':gsi1sk': queue_sort_key(item.get('priority', DEFAULT_QUEUE_PRIORITY), base_priority_score, item.get('due_at'))
+                },
+                ReturnValues='ALL_NEW'
+            )
+            invalidate_family_cache(family_id)
+            
+            return response.get('Attributes', {})
         except Exception as e:
-            logger.error(f"Error getting care queue for family {family_id}: {e}")
+            logger.error(f"Error escalating queue item {queue_item_id}: {e}")
+            raise
+    
+    def backfill_queue_sort_keys(self, family_id: str) -> int:
+        """Rewrite a family's queue items to the current GSI1SK layout, returning how many changed
+        
+        One-off migration for items written with the older {priority:03d}#{due_at}
+        or time-dependent {rank:04d}#{due_at} keys, which sort out of place
+        against current keys until rewritten. Safe to re-run.
+        """
+        paginator = self.table.meta.client.get_paginator('query')
+        pages = paginator.paginate(
+            TableName=self.table_name,
+            IndexName='GSI1',
+            KeyConditionExpression=Key('GSI1PK').eq(f'QUEUE#{family_id}')
+        )
+        
+        updated = 0
+        for page in pages:
+            for item in page.get('Items', []):
+                base_priority_score = base_priority_score_for_item(item)
+                sort_key = queue_sort_key(item.get('priority', DEFAULT_QUEUE_PRIORITY), base_priority_score, item.get('due_at'))
+                if item.get('GSI1SK') == sort_key and 'priority_score' not in item:
+                    continue
+                
+                self.table.update_item(
+                    Key={'PK': item['PK'], 'SK': item['SK']},
+                    UpdateExpression='SET base_priority_score = :score, GSI1SK = :gsi1sk REMOVE priority_score',
+                    ExpressionAttributeValues={':score': base_priority_score, ':gsi1sk': sort_key}
+                )
+                updated += 1
+        
+        if updated:
+            invalidate_family_cache(family_id)
+        logger.info(f"Backfilled {updated} queue sort keys for family {family_id}")
+        return updated
+    
+    def get_due_today(self, family_id: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get tasks and queue items due today (UTC) from the due-date bucket index"""
+        try:
+            return self._query_due_today(family_id, entity_type)
+        except Exception as e:
+            logger.error(f"Error getting items due today for family {family_id}: {e}")
             return []
     
+    def _query_due_today(self, family_id: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Query today's due-date bucket, raising on failure"""
+        today = datetime.now(timezone.utc).date().isoformat()
+        query_kwargs = {
+            'IndexName': 'GSI3',
+            'KeyConditionExpression': Key('GSI3PK').eq(f'DUEDATE#{family_id}#{today}'),
+            'ScanIndexForward': True  # Due time ascending
+        }
+        
+        if entity_type:
+            query_kwargs['FilterExpression'] = Attr('entity_type').eq(entity_type)
+        
+        return self._query_items(**query_kwargs)
+    
     def get_urgent_items(self, family_id: str) -> List[Dict[str, Any]]:
         """Get urgent items requiring immediate attention"""
         try:
-            # Get urgent alerts
-            urgent_alerts = self.get_alerts_by_severity(AlertSeverity.URGENT)
-            
-            # Get high priority tasks
-            response = self.table.query(
+            return _copy_items(self._cached_urgent_items(family_id))
+        except Exception as e:
+            logger.error(f"Error getting urgent items for family {family_id}: {e}")
+            return []
+    
+    @cached(_read_cache, key=_family_cache_key('urgent_items'), lock=_read_cache_lock)
+    def _cached_urgent_items(self, family_id: str) -> Tuple[Dict[str, Any], ...]:
+        """Cached urgent item read; raises on failure so errors are never cached"""
+        # Urgent alerts and urgent tasks are independent queries, so run
+        # them concurrently instead of paying two serial round trips.
+        # Both go through the low-level client: boto3 resources are not thread-safe.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            alerts_future = executor.submit(
+                self._query_alerts_by_severity, AlertSeverity.URGENT, family_id=family_id
+            )
+            tasks_future = executor.submit(
+                self._query_items,
                 IndexName='GSI2',
                 KeyConditionExpression=Key('GSI2PK').eq('PRIORITY#urgent'),
+                FilterExpression=Attr('PK').eq(f'FAMILY#{family_id}'),
                 ScanIndexForward=True
             )
-            urgent_tasks = response.get('Items', [])
-            
-            # Combine and format as urgent items
-            urgent_items = []
-            
-            for alert in urgent_alerts:
-                if alert.get('PK') == f'FAMILY#{family_id}':
-                    urgent_items.append({
-                        'id': alert.get('alert_id'),
-                        'type': alert.get('type'),
-                        'severity': alert.get('severity'),
-                        'elderName': alert.get('elder_name'),
-                        'timeElapsed': self._calculate_time_elapsed(alert.get('created_at')),
-                        'suggestedAction': self._get_suggested_action(alert),
-                        'triageStatus': 'pending'
-                    })
-            
-            for task in urgent_tasks:
-                if task.get('PK') == f'FAMILY#{family_id}':
-                    urgent_items.append({
-                        'id': task.get('task_id'),
-                        'type': 'task',
-                        'severity': task.get('priority'),
-                        'elderName': task.get('elder_name'),
-                        'timeElapsed': self._calculate_time_elapsed(task.get('created_at')),
-                        'suggestedAction': task.get('title'),
-                        'triageStatus': 'pending'
-                    })
-            
-            return urgent_items
-        except Exception as e:
-            logger.error(f"Error getting urgent items for family {family_id}: {e}")
-            return []
+            urgent_alerts = alerts_future.result()
+            urgent_tasks = tasks_future.result()
+        
+        # Combine and format as urgent items
+        urgent_items = []
+        now_epoch = int(time.time())
+        
+        # Both queries are filtered to the family server-side
+        for alert in urgent_alerts:
+            urgent_items.append({
+                'id': alert.get('alert_id'),
+                'type': alert.get('type'),
+                'severity': alert.get('severity'),
+                'elderName': alert.get('elder_name'),
+                'timeElapsed': self._calculate_time_elapsed(alert, now_epoch),
+                'suggestedAction': self._get_suggested_action(alert),
+                'triageStatus': 'pending'
+            })
+        
+        for task in urgent_tasks:
+            urgent_items.append({
+                'id': task.get('task_id'),
+                'type': 'task',
+                'severity': task.get('priority'),
+                'elderName': task.get('elder_name'),
+                'timeElapsed': self._calculate_time_elapsed(task, now_epoch),
+                'suggestedAction': task.get('title'),
+                'triageStatus': 'pending'
+            })
+        
+        return tuple(urgent_items)
+    
+    def get_dashboard(self, family_id: str, timeline_limit: int = 20) -> Dict[str, Any]:
+        """Get alerts, tasks, care queue and recent timeline for a family in one call
+        
+        The four reads are independent, so they run concurrently and the call
+        costs roughly one round trip instead of four. Workers query through the
+        low-level clients (boto3 resources are not thread-safe) and bypass the
+        read cache, so no cache lock is taken off the calling thread.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'alerts': executor.submit(self._query_alerts_by_family, family_id),
+                'tasks': executor.submit(self._query_tasks_by_family, family_id),
+                'queue': executor.submit(self._query_care_queue, family_id),
+                'timeline': executor.submit(self._query_timeline_by_family, family_id, timeline_limit)
+            }
+        
+        # A failed read empties its own section only, as the individual getters do
+        dashboard = {}
+        for section, future in futures.items():
+            try:
+                dashboard[section] = future.result()
+            except Exception as e:
+                logger.error(f"Error getting dashboard {section} for family {family_id}: {e}")
+                dashboard[section] = {'items': [], 'totalCount': 0} if section == 'timeline' else []
+        
+        return dashboard
     
     # =============================================
     # Timeline Operations
@@ -516,7 +860,7 @@ class CareOperationsDAO:
         """Create an immutable timeline entry"""
         try:
             item = entry.to_dynamodb_item(family_id)
-            self.table.put_item(Item=item)
+            self._put_item_fast(item)
             logger.info(f"Created timeline entry {entry.id} for family {family_id}")
             return item
         except Exception as e:
@@ -525,7 +869,11 @@ class CareOperationsDAO:
     
     def get_timeline_by_elder(self, elder_id: str, limit: int = 50, 
                             next_token: Optional[str] = None) -> Dict[str, Any]:
-        """Get timeline entries for a specific elder"""
+        """Get timeline entries for a specific elder
+        
+        Reads through DAX when configured, so entries written within the DAX
+        query-cache TTL may not appear yet; timeline entries are append-only.
+        """
         try:
             query_kwargs = {
                 'IndexName': 'GSI1',
@@ -535,9 +883,9 @@ class CareOperationsDAO:
             }
             
             if next_token:
-                query_kwargs['ExclusiveStartKey'] = json.loads(next_token)
+                query_kwargs['ExclusiveStartKey'] = decode_next_token(next_token)
             
-            response = self.table.query(**query_kwargs)
+            response = self.read_table.query(**query_kwargs)
             
             result = {
                 'items': response.get('Items', []),
@@ -545,7 +893,7 @@ class CareOperationsDAO:
             }
             
             if 'LastEvaluatedKey' in response:
-                result['nextToken'] = json.dumps(response['LastEvaluatedKey'])
+                result['nextToken'] = encode_next_token(response['LastEvaluatedKey'])
             
             return result
         except Exception as e:
@@ -556,31 +904,37 @@ class CareOperationsDAO:
                              next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get timeline entries for a family"""
         try:
-            query_kwargs = {
-                'IndexName': 'GSI2',
-                'KeyConditionExpression': Key('GSI2PK').eq(f'TIMELINE#{family_id}'),
-                'ScanIndexForward': False,  # Most recent first
-                'Limit': limit
-            }
-            
-            if next_token:
-                query_kwargs['ExclusiveStartKey'] = json.loads(next_token)
-            
-            response = self.table.query(**query_kwargs)
-            
-            result = {
-                'items': response.get('Items', []),
-                'totalCount': response.get('Count', 0)
-            }
-            
-            if 'LastEvaluatedKey' in response:
-                result['nextToken'] = json.dumps(response['LastEvaluatedKey'])
-            
-            return result
+            return self._query_timeline_by_family(family_id, limit, next_token)
         except Exception as e:
             logger.error(f"Error getting timeline for family {family_id}: {e}")
             return {'items': [], 'totalCount': 0}
     
+    def _query_timeline_by_family(self, family_id: str, limit: int = 50,
+                                  next_token: Optional[str] = None) -> Dict[str, Any]:
+        """Query a page of a family's timeline, raising on failure"""
+        query_kwargs = {
+            'TableName': self.table_name,
+            'IndexName': 'GSI2',
+            'KeyConditionExpression': Key('GSI2PK').eq(f'TIMELINE#{family_id}'),
+            'ScanIndexForward': False,  # Most recent first
+            'Limit': limit
+        }
+        
+        if next_token:
+            query_kwargs['ExclusiveStartKey'] = decode_next_token(next_token)
+        
+        response = self.table.meta.client.query(**query_kwargs)
+        
+        result = {
+            'items': response.get('Items', []),
+            'totalCount': response.get('Count', 0)
+        }
+        
+        if 'LastEvaluatedKey' in response:
+            result['nextToken'] = encode_next_token(response['LastEvaluatedKey'])
+        
+        return result
+    
     # =============================================
     # Outcome Operations
     # =============================================
@@ -589,7 +943,7 @@ class CareOperationsDAO:
         """Create a task outcome"""
         try:
             item = outcome.to_dynamodb_item(family_id)
-            self.table.put_item(Item=item)
+            self._put_item_fast(item)
             logger.info(f"Created outcome {outcome.id} for task {outcome.task_id}")
             return item
         except Exception as e:
@@ -625,7 +979,11 @@ class CareOperationsDAO:
             raise
     
     def get_plan_by_alert(self, alert_id: str) -> Optional[Dict[str, Any]]:
-        """Get the plan associated with an alert"""
+        """Get the plan associated with an alert
+        
+        Reads the base table rather than DAX: the triage UI reads the plan right
+        after update_plan_step, and DAX's query cache would return the old step.
+        """
         try:
             response = self.table.query(
                 IndexName='GSI1',
@@ -660,13 +1018,30 @@ class CareOperationsDAO:
     # Helper Methods
     # =============================================
     
-    def _calculate_time_elapsed(self, created_at: str) -> int:
-        """Calculate minutes elapsed since creation"""
+    def _query_items(self, **query_kwargs) -> List[Dict[str, Any]]:
+        """Query through the table's low-level client, which unlike the resource is thread-safe
+        
+        The resource's client keeps boto3's condition and attribute-value
+        transformation, so Key/Attr conditions and plain Python values work as usual.
+        """
+        response = self.table.meta.client.query(TableName=self.table_name, **query_kwargs)
+        return response.get('Items', [])
+    
+    def _put_item_fast(self, item: Dict[str, Any]) -> None:
+        """Put an item through the low-level client with the shared serializer"""
+        self.client.put_item(
+            TableName=self.table_name,
+            Item={key: type_serializer.serialize(value) for key, value in item.items()}
+        )
+    
+    def _calculate_time_elapsed(self, item: Dict[str, Any], now_epoch: Optional[int] = None) -> int:
+        """Calculate minutes elapsed since an item's creation, relative to `now_epoch` if given"""
         try:
-            created_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            now = datetime.utcnow().replace(tzinfo=created_time.tzinfo)
-            elapsed = now - created_time
-            return int(elapsed.total_seconds() / 60)
+            created_epoch = item.get('created_at_epoch')
+            if created_epoch is None:
+                # Items written before created_at_epoch existed
+                created_epoch = to_epoch_seconds(item.get('created_at'))
+            return (int(now_epoch or time.time()) - int(created_epoch)) // 60
         except Exception:
             return 0
     
@@ -675,15 +1050,12 @@ class CareOperationsDAO:
         alert_type = alert.get('type', '')
         severity = alert.get('severity', '')
         
+        action = SUGGESTED_ACTIONS.get((severity, alert_type))
+        if action:
+            return action
         if severity == 'urgent':
-            if alert_type == 'fall':
-                return 'Start Urgent Triage Protocol'
-            elif alert_type == 'medication':
-                return 'Verify Medication Status'
-            else:
-                return 'Take Immediate Action'
-        else:
-            return f'Review {alert_type.title()} Alert'
+            return URGENT_DEFAULT_ACTION
+        return REVIEW_ACTIONS.get(alert_type) or f'Review {alert_type.title()} Alert'
 
 # =============================================
 # Utility Functions
@@ -692,47 +1064,110 @@ class CareOperationsDAO:
 def generate_id(prefix: str = '') -> str:
     """Generate unique ID with optional prefix"""
     from uuid import uuid4
-    timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')
     unique = str(uuid4())[:8]
     return f"{prefix}#{timestamp}-{unique}" if prefix else f"{timestamp}-{unique}"
 
-def calculate_priority_score(severity: AlertSeverity, due_at: Optional[str] = None, 
-                           elder_risk_level: str = 'medium', 
-                           assignment_status: str = 'unassigned',
-                           escalation_count: int = 0) -> int:
-    """Calculate priority score for queue ordering"""
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with a 'Z' suffix"""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+@lru_cache(maxsize=1024)
+def parse_utc_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as an aware UTC datetime (naive values are treated as UTC)"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def to_epoch_seconds(value: str) -> int:
+    """Convert an ISO 8601 timestamp to integer seconds since the epoch"""
+    return int(parse_utc_timestamp(value).timestamp())
+
+def created_epoch_attribute(created_at: Optional[str]) -> Dict[str, int]:
+    """Build the created_at_epoch attribute, or nothing if created_at is not ISO 8601"""
+    try:
+        return {'created_at_epoch': to_epoch_seconds(created_at)}
+    except (TypeError, ValueError):
+        # Readers fall back to created_at when the attribute is missing
+        return {}
+
+def encode_next_token(last_evaluated_key: Dict[str, Any]) -> str:
+    """Encode a DynamoDB LastEvaluatedKey as an opaque, URL-safe pagination token"""
+    return base64.urlsafe_b64encode(orjson.dumps(last_evaluated_key, default=str)).decode()
+
+def decode_next_token(next_token: str) -> Dict[str, Any]:
+    """Decode a pagination token produced by encode_next_token"""
+    return orjson.loads(base64.urlsafe_b64decode(next_token))
+
+def calculate_base_priority_score(severity: AlertSeverity, elder_risk_level: str = 'medium',
+                                  assignment_status: str = 'unassigned',
+                                  escalation_count: int = 0) -> int:
+    """Time-independent part of the priority score, safe to store and index"""
     # Base severity score
-    severity_scores = {
-        AlertSeverity.URGENT: 100,
-        AlertSeverity.HIGH: 75,
-        AlertSeverity.MEDIUM: 50,
-        AlertSeverity.LOW: 25
-    }
-    
-    score = severity_scores.get(severity, 25)
-    
-    # Time sensitivity bonus
-    if due_at:
-        try:
-            due_time = datetime.fromisoformat(due_at.replace('Z', '+00:00'))
-            now = datetime.utcnow().replace(tzinfo=due_time.tzinfo)
-            
-            if due_time < now:  # Overdue
-                score += 50
-            elif (due_time - now).days == 0:  # Due today
-                score += 25
-        except Exception:
-            pass
+    score = SEVERITY_BASE_SCORES.get(severity, 25)
     
     # Elder risk level bonus
     if elder_risk_level == 'high':
-        score += 20
+        score += HIGH_RISK_BONUS
     
     # Assignment status bonus
     if assignment_status == 'unassigned':
-        score += 15
+        score += UNASSIGNED_BONUS
     
     # Escalation bonus
-    score += escalation_count * 10
+    score += escalation_count * ESCALATION_BONUS
+    
+    return score
+
+def due_time_bonus(due_at: Optional[str], now: Optional[datetime] = None) -> int:
+    """Time sensitivity bonus for an item due at `due_at`, relative to `now` (aware UTC) if given"""
+    if not due_at:
+        return 0
+    try:
+        seconds_until_due = (parse_utc_timestamp(due_at) - (now or datetime.now(timezone.utc))).total_seconds()
+    except Exception:
+        return 0
+    
+    if seconds_until_due < 0:  # Overdue
+        return OVERDUE_BONUS
+    if seconds_until_due < SECONDS_PER_DAY:  # Due within a day
+        return DUE_TODAY_BONUS
+    return 0
+
+def calculate_priority_score(severity: AlertSeverity, due_at: Optional[str] = None, 
+                           elder_risk_level: str = 'medium', 
+                           assignment_status: str = 'unassigned',
+                           escalation_count: int = 0,
+                           now: Optional[datetime] = None) -> int:
+    """Calculate priority score for queue ordering, relative to `now` (aware UTC) if given"""
+    return calculate_base_priority_score(
+        severity,
+        elder_risk_level=elder_risk_level,
+        assignment_status=assignment_status,
+        escalation_count=escalation_count
+    ) + due_time_bonus(due_at, now)
+
+def base_priority_score_for_item(item: Dict[str, Any]) -> int:
+    """Time-independent priority score of a queue item (DynamoDB dict)"""
+    return calculate_base_priority_score(
+        SEVERITY_BY_VALUE.get(item.get('severity'), AlertSeverity.LOW),
+        elder_risk_level=item.get('elder_risk_level', 'medium'),
+        assignment_status='assigned' if item.get('assigned_to') else 'unassigned',
+        escalation_count=int(item.get('escalation_count', 0))
+    )
+
+def calculate_priority_scores_batch(items: List[Dict[str, Any]], 
+                                    now: Optional[datetime] = None) -> List[int]:
+    """Score many queue items (DynamoDB dicts) against a single clock reading"""
+    now = now or datetime.now(timezone.utc)
+    return [base_priority_score_for_item(item) + due_time_bonus(item.get('due_at'), now) for item in items]
+
+def rank_queue_items(items: List[Dict[str, Any]], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Set each queue item's current priority_score and order items by priority, then score
     
-    return score
\ No newline at end of file
+    Items arrive in GSI1 order, which already reflects the stored base scores, so
+    the stable sort only moves items whose due-time bonus changed their place.
+    """
+    for item, priority_score in zip(items, calculate_priority_scores_batch(items, now)):
+        item['priority_score'] = priority_score
+    items.sort(key=lambda item: (int(item.get('priority', DEFAULT_QUEUE_PRIORITY)), -item['priority_score']))
+    return items
@@ -5,7 +5,7 @@ Defines the table structure and access patterns for the single-table design
 
 import boto3
 import os
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from aws_lambda_powertools import Logger
 
 logger = Logger()
@@ -20,7 +20,7 @@ ACCESS_PATTERNS = {
         'index': 'GSI1',
         'pk': 'QUEUE#{family_id}',
         'sk_prefix': None,
-        'sort_order': 'ASC'  # Priority ascending (urgent first)
+        'sort_order': 'ASC'  # Lowest priority, then highest priority score first
     },
     
     # Pattern 2: Get tasks assigned to specific user
@@ -63,6 +63,14 @@ ACCESS_PATTERNS = {
         'sk_prefix': None,
         'sort_order': 'ASC',
         'projection': ['assigned_to', 'estimated_minutes', 'status']
+    },
+    
+    # Pattern 7: Get tasks and queue items due on a given day
+    'get_due_by_date': {
+        'index': 'GSI3',
+        'pk': 'DUEDATE#{family_id}#{date}',
+        'sk_prefix': None,
+        'sort_order': 'ASC'  # Due time ascending
     }
 }
 
@@ -76,7 +84,7 @@ KEY_PATTERNS = {
     'family_timeline': 'FAMILY#{family_id}|TIMELINE#{timeline_id}',
     
     # GSI1 Keys (Queue Management)
-    'queue_family': 'QUEUE#{family_id}|{priority:03d}#{due_at}',
+    'queue_family': 'QUEUE#{family_id}|{priority:03d}#{rank:04d}#{due_at}',  # rank = 9999 - base_priority_score
     'assignee_task': 'ASSIGNEE#{user_id}|{due_at}',
     'elder_timeline': 'ELDER#{elder_id}|{occurred_at}',
     'alert_plan': 'ALERT#{alert_id}|{started_at}',
@@ -89,6 +97,17 @@ KEY_PATTERNS = {
     # GSI3 Keys (Analytics and Reporting)
     'metrics_family': 'METRICS#{family_id}|{date}',
     'workload_member': 'WORKLOAD#{user_id}|{date}',
+    'due_date_family': 'DUEDATE#{family_id}#{date}|{due_at}',
+}
+
+# Queue GSI1SK ranks are MAX_PRIORITY_SCORE - base_priority_score, so ascending order is urgent first
+MAX_PRIORITY_SCORE = 9999
+DEFAULT_QUEUE_PRIORITY = 50
+
+# Key patterns pre-split into (PK pattern, SK pattern) at import time
+_COMPILED_KEY_PATTERNS: Dict[str, Tuple[str, Optional[str]]] = {
+    name: tuple(pattern.split('|', 1)) if '|' in pattern else (pattern, None)
+    for name, pattern in KEY_PATTERNS.items()
 }
 
 def create_table_if_not_exists():
@@ -163,16 +182,11 @@ def create_table_if_not_exists():
 def get_key_pattern(pattern_name: str, **kwargs) -> Dict[str, str]:
     """Generate DynamoDB keys based on pattern"""
     try:
-        pattern = KEY_PATTERNS.get(pattern_name)
-        if not pattern:
+        compiled = _COMPILED_KEY_PATTERNS.get(pattern_name)
+        if not compiled:
             raise ValueError(f"Unknown key pattern: {pattern_name}")
         
-        # Split pattern into PK and SK
-        if '|' in pattern:
-            pk_pattern, sk_pattern = pattern.split('|', 1)
-        else:
-            pk_pattern = pattern
-            sk_pattern = None
+        pk_pattern, sk_pattern = compiled
         
         # Format the patterns with provided kwargs
         pk = pk_pattern.format(**kwargs)
@@ -201,70 +215,106 @@ def validate_access_pattern(pattern_name: str) -> bool:
     except Exception:
         return False
 
+def _alert_gsi_keys(entity_data: Dict[str, Any], family_id: str) -> Dict[str, Any]:
+    """GSI1: Elder timeline, GSI2: Severity-based queries"""
+    return {
+        'GSI1PK': f"ELDER#{entity_data.get('elder_id')}",
+        'GSI1SK': f"ALERT#{entity_data.get('created_at')}",
+        'GSI2PK': f"SEVERITY#{entity_data.get('severity')}",
+        'GSI2SK': entity_data.get('created_at')
+    }
+
+def _due_date_gsi_keys(due_at: Optional[str], family_id: str) -> Dict[str, Any]:
+    """GSI3: Due-date bucket, omitted when there is no due date"""
+    if not due_at:
+        return {}
+    return {
+        'GSI3PK': f"DUEDATE#{family_id}#{due_at[:10]}",
+        'GSI3SK': due_at
+    }
+
+def _task_gsi_keys(entity_data: Dict[str, Any], family_id: str) -> Dict[str, Any]:
+    """GSI1: Assignment queries, GSI2: Priority-based queries, GSI3: Due date"""
+    assigned_to = entity_data.get('assigned_to')
+    sort_key = entity_data.get('due_at') or entity_data.get('created_at')
+    return {
+        'GSI1PK': f"ASSIGNEE#{assigned_to}" if assigned_to else 'UNASSIGNED',
+        'GSI1SK': sort_key,
+        'GSI2PK': f"PRIORITY#{entity_data.get('priority')}",
+        'GSI2SK': sort_key,
+        **_due_date_gsi_keys(entity_data.get('due_at'), family_id)
+    }
+
+def queue_sort_key(priority: int, base_priority_score: Optional[int], due_at: Optional[str]) -> str:
+    """Build the queue GSI1SK: caller priority first (lowest first), then highest base score, then due time
+    
+    The base score must be time-independent; due-time bonuses are applied on read.
+    Without a base score the rank comes from priority alone, so the item sorts
+    after scored items of the same priority.
+    """
+    rank = MAX_PRIORITY_SCORE if base_priority_score is None else MAX_PRIORITY_SCORE - int(base_priority_score)
+    rank = min(max(rank, 0), MAX_PRIORITY_SCORE)
+    return f'{int(priority):03d}#{rank:04d}#{due_at}'
+
+def _queue_item_gsi_keys(entity_data: Dict[str, Any], family_id: str) -> Dict[str, Any]:
+    """GSI1: Queue management (priority, then highest score first), GSI2: Assignment tracking, GSI3: Due date"""
+    due_at = entity_data.get('due_at')
+    assigned_to = entity_data.get('assigned_to')
+    return {
+        'GSI1PK': f"QUEUE#{family_id}",
+        'GSI1SK': queue_sort_key(
+            entity_data.get('priority', DEFAULT_QUEUE_PRIORITY), entity_data.get('base_priority_score'), due_at
+        ),
+        'GSI2PK': f"ASSIGNEE#{assigned_to}" if assigned_to else 'UNASSIGNED',
+        'GSI2SK': due_at,
+        **_due_date_gsi_keys(due_at, family_id)
+    }
+
+def _timeline_gsi_keys(entity_data: Dict[str, Any], family_id: str) -> Dict[str, Any]:
+    """GSI1: Elder timeline, GSI2: Family timeline"""
+    return {
+        'GSI1PK': f"ELDER#{entity_data.get('elder_id')}",
+        'GSI1SK': entity_data.get('occurred_at'),
+        'GSI2PK': f"TIMELINE#{family_id}",
+        'GSI2SK': entity_data.get('occurred_at')
+    }
+
+def _plan_gsi_keys(entity_data: Dict[str, Any], family_id: str) -> Dict[str, Any]:
+    """GSI1: Alert-to-plan mapping"""
+    return {
+        'GSI1PK': f"ALERT#{entity_data.get('alert_id')}",
+        'GSI1SK': entity_data.get('started_at')
+    }
+
+def _outcome_gsi_keys(entity_data: Dict[str, Any], family_id: str) -> Dict[str, Any]:
+    """GSI1: Task outcomes"""
+    return {
+        'GSI1PK': f"TASK#{entity_data.get('task_id')}",
+        'GSI1SK': entity_data.get('recorded_at')
+    }
+
+# GSI key builders by entity type
+_GSI_KEY_BUILDERS: Dict[str, Callable[[Dict[str, Any], str], Dict[str, Any]]] = {
+    'alert': _alert_gsi_keys,
+    'task': _task_gsi_keys,
+    'queue_item': _queue_item_gsi_keys,
+    'timeline': _timeline_gsi_keys,
+    'plan': _plan_gsi_keys,
+    'outcome': _outcome_gsi_keys,
+}
+
 def get_gsi_keys_for_entity(entity_type: str, entity_data: Dict[str, Any], 
                            family_id: str) -> Dict[str, Any]:
     """Generate GSI keys based on entity type and data"""
-    gsi_keys = {}
+    builder = _GSI_KEY_BUILDERS.get(entity_type)
+    if not builder:
+        return {}
     
     try:
-        if entity_type == 'alert':
-            # GSI1: Elder timeline
-            gsi_keys['GSI1PK'] = f"ELDER#{entity_data.get('elder_id')}"
-            gsi_keys['GSI1SK'] = f"ALERT#{entity_data.get('created_at')}"
-            
-            # GSI2: Severity-based queries
-            gsi_keys['GSI2PK'] = f"SEVERITY#{entity_data.get('severity')}"
-            gsi_keys['GSI2SK'] = entity_data.get('created_at')
-            
-        elif entity_type == 'task':
-            # GSI1: Assignment queries
-            if entity_data.get('assigned_to'):
-                gsi_keys['GSI1PK'] = f"ASSIGNEE#{entity_data.get('assigned_to')}"
-            else:
-                gsi_keys['GSI1PK'] = 'UNASSIGNED'
-            gsi_keys['GSI1SK'] = entity_data.get('due_at') or entity_data.get('created_at')
-            
-            # GSI2: Priority-based queries
-            gsi_keys['GSI2PK'] = f"PRIORITY#{entity_data.get('priority')}"
-            gsi_keys['GSI2SK'] = entity_data.get('due_at') or entity_data.get('created_at')
-            
-        elif entity_type == 'queue_item':
-            # GSI1: Queue management
-            priority = entity_data.get('priority', 50)
-            due_at = entity_data.get('due_at')
-            gsi_keys['GSI1PK'] = f"QUEUE#{family_id}"
-            gsi_keys['GSI1SK'] = f"{priority:03d}#{due_at}"
-            
-            # GSI2: Assignment tracking
-            if entity_data.get('assigned_to'):
-                gsi_keys['GSI2PK'] = f"ASSIGNEE#{entity_data.get('assigned_to')}"
-            else:
-                gsi_keys['GSI2PK'] = 'UNASSIGNED'
-            gsi_keys['GSI2SK'] = due_at
-            
-        elif entity_type == 'timeline':
-            # GSI1: Elder timeline
-            gsi_keys['GSI1PK'] = f"ELDER#{entity_data.get('elder_id')}"
-            gsi_keys['GSI1SK'] = entity_data.get('occurred_at')
-            
-            # GSI2: Family timeline
-            gsi_keys['GSI2PK'] = f"TIMELINE#{family_id}"
-            gsi_keys['GSI2SK'] = entity_data.get('occurred_at')
-            
-        elif entity_type == 'plan':
-            # GSI1: Alert-to-plan mapping
-            gsi_keys['GSI1PK'] = f"ALERT#{entity_data.get('alert_id')}"
-            gsi_keys['GSI1SK'] = entity_data.get('started_at')
-            
-        elif entity_type == 'outcome':
-            # GSI1: Task outcomes
-            gsi_keys['GSI1PK'] = f"TASK#{entity_data.get('task_id')}"
-            gsi_keys['GSI1SK'] = entity_data.get('recorded_at')
-            
+        return builder(entity_data, family_id)
     except Exception as e:
         logger.error(f"Error generating GSI keys for {entity_type}: {e}")
-    
-    return gsi_keys
+        return {}
 
 # Example usage and testing
 if __name__ == "__main__":
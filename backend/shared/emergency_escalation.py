@@ -3,21 +3,67 @@ Emergency Safety Escalation - Backend Implementation
 Handles emergency services integration, contact management, and call logging
 """
 
-import json
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 from enum import Enum
+from operator import attrgetter
+from threading import Lock
 import boto3
+from botocore.config import Config
+from cachetools import TTLCache
 from aws_lambda_powertools import Logger
 
 logger = Logger()
 
 # AWS Clients
-sns = boto3.client('sns')
+# Tight timeouts so one slow SMS publish cannot stall the emergency path
+sns = boto3.client('sns', config=Config(connect_timeout=2, read_timeout=3, retries={'max_attempts': 1}))
 dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'CareCircle-Data'))
+TABLE_NAME = os.environ.get('DYNAMODB_TABLE', 'CareCircle-Data')
+table = dynamodb.Table(TABLE_NAME)
+
+# Optional DAX cluster for emergency-path reads (requires amazon-dax-client).
+# Writes always go straight to DynamoDB.
+DAX_ENDPOINT = os.environ.get('DAX_ENDPOINT')
+
+def _create_read_table():
+    """Use DAX for cached reads when configured, falling back to the table"""
+    if not DAX_ENDPOINT:
+        return table
+    try:
+        import amazondax
+        dax = amazondax.AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT)
+        return dax.Table(TABLE_NAME)
+    except Exception as e:
+        logger.warning(f"DAX unavailable, reading from DynamoDB directly: {e}")
+        return table
+
+read_table = _create_read_table()
+
+# Emergency contacts change rarely; keep them warm across invocations for display
+# reads. Notification delivery always reads fresh, since other containers'
+# caches are not invalidated by a contact edit.
+CONTACTS_CACHE_TTL_SECONDS = int(os.environ.get('CONTACTS_CACHE_TTL_SECONDS', '60'))
+_contacts_cache = TTLCache(maxsize=1024, ttl=CONTACTS_CACHE_TTL_SECONDS)
+_contacts_cache_lock = Lock()
+
+# Attributes read back into EmergencyContact
+CONTACT_PROJECTION = (
+    'contact_id, #n, phone, relationship, priority, contact_type, is_available, '
+    'last_contacted_at, notification_preferences, created_at, updated_at'
+)
+
+def invalidate_contacts_cache(family_id: str) -> None:
+    """Drop cached emergency contacts for a family after a write"""
+    with _contacts_cache_lock:
+        _contacts_cache.pop(family_id, None)
+
+def _chance(probability: float) -> bool:
+    """Return True with roughly the given probability using one random byte"""
+    return os.urandom(1)[0] < int(probability * 256)
 
 # =============================================
 # Enums and Data Classes
@@ -42,7 +88,18 @@ class ContactType(Enum):
     EMERGENCY_SERVICES = "emergency_services"
     CAREGIVER = "caregiver"
 
-@dataclass
+# Plain dict lookups for request values instead of Enum.__call__
+SCENARIO_BY_VALUE = {scenario.value: scenario for scenario in EmergencyScenario}
+CONTACT_TYPE_BY_VALUE = {contact_type.value: contact_type for contact_type in ContactType}
+
+def _enum_from_value(lookup: Dict[str, Enum], value: str, enum_name: str) -> Enum:
+    """Resolve an enum member by value, raising ValueError like the Enum constructor"""
+    member = lookup.get(value)
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum_name}")
+    return member
+
+@dataclass(slots=True, frozen=True)
 class EmergencyContact:
     id: str
     name: str
@@ -53,8 +110,27 @@ class EmergencyContact:
     is_available: Optional[bool] = None
     last_contacted_at: Optional[str] = None
     notification_preferences: Optional[Dict[str, bool]] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'phone': self.phone,
+            'relationship': self.relationship,
+            'priority': self.priority,
+            'contact_type': self.contact_type.value,
+            'is_available': self.is_available,
+            'last_contacted_at': self.last_contacted_at,
+            # Copy so callers cannot mutate contacts shared through the cache
+            'notification_preferences': dict(self.notification_preferences) if self.notification_preferences is not None else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmergencyCallRequest:
     alert_id: str
     elder_id: str
@@ -65,7 +141,7 @@ class EmergencyCallRequest:
     triage_responses: Optional[Dict[str, Any]] = None
     requested_by: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmergencyCallResult:
     call_id: str
     status: CallStatus
@@ -75,8 +151,21 @@ class EmergencyCallResult:
     call_script: str
     location: Optional[str] = None
     response_time_seconds: Optional[int] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict"""
+        return {
+            'call_id': self.call_id,
+            'status': self.status.value,
+            'timestamp': self.timestamp,
+            'emergency_services_called': self.emergency_services_called,
+            'contacts_notified': self.contacts_notified,
+            'call_script': self.call_script,
+            'location': self.location,
+            'response_time_seconds': self.response_time_seconds
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CallScript:
     scenario: str
     primary_script: str
@@ -86,6 +175,122 @@ class CallScript:
     location: str = ""
     callback_number: str = ""
 
+# =============================================
+# Call Script Templates
+# =============================================
+
+FALL_KEY_INFO = (
+    "Patient: {elder_name}",
+    "Incident: Fall",
+    "Conscious: {consciousness}",
+    "Severe injury: {severe_injury}",
+    "Pain level: {pain_level}/10",
+    "Head injury: {head_injury}",
+    "Can move: {mobility}"
+)
+
+INJURY_KEY_INFO = (
+    "Patient: {elder_name}",
+    "Incident: Injury",
+    "Conscious: {consciousness}",
+    "Bleeding: {bleeding}",
+    "Breathing normal: {breathing}",
+    "Pain level: {pain_level}/10",
+    "Injury location: {injury_location}"
+)
+
+CHEST_PAIN_KEY_INFO = (
+    "Patient: {elder_name}",
+    "Incident: Chest Pain",
+    "Conscious: {consciousness}",
+    "Pain severity: {pain_severity}/10",
+    "Breathing difficulty: {breathing_difficulty}",
+    "Sweating/nausea: {sweating_nausea}",
+    "Pain radiating: {pain_radiation}",
+    "Cardiac history: {cardiac_history}"
+)
+
+CONFUSION_KEY_INFO = (
+    "Patient: {elder_name}",
+    "Incident: Confusion/Altered Mental State",
+    "Responsive: {responsiveness}",
+    "Orientation: {orientation}",
+    "Physical symptoms: {physical_symptoms}",
+    "Onset: {confusion_onset}",
+    "Safety concerns: {safety_concerns}"
+)
+
+GENERAL_KEY_INFO = (
+    "Patient: {elder_name}",
+    "Incident: Medical Emergency",
+    "Location: {location}"
+)
+
+FALL_SCRIPT_PREFIX = "This is a medical emergency. An elderly person named {elder_name} has fallen. "
+INJURY_SCRIPT_PREFIX = "This is a medical emergency. An elderly person named {elder_name} has sustained an injury. "
+CHEST_PAIN_SCRIPT_PREFIX = "This is a medical emergency. An elderly person named {elder_name} is experiencing severe chest pain. "
+CONFUSION_SCRIPT_PREFIX = "This is a medical emergency. An elderly person named {elder_name} is experiencing severe confusion or altered mental state. "
+GENERAL_SCRIPT_PREFIX = "This is a medical emergency involving an elderly person named {elder_name}. "
+AMBULANCE_REQUEST = "Please send an ambulance immediately to {location}."
+
+def _yes_no(value: Any) -> str:
+    """Render a triage answer as Yes/No for call scripts"""
+    return 'Yes' if value else 'No'
+
+def _render_key_info(templates: Tuple[str, ...], context: Dict[str, Any]) -> List[str]:
+    """Fill key information templates from a context dict"""
+    return [template.format_map(context) for template in templates]
+
+# =============================================
+# Condition Assessment Rules
+# =============================================
+
+def _chest_pain_score(responses: Dict[str, Any]) -> float:
+    """Read the chest pain severity as a number, treating bad input as 0"""
+    try:
+        return float(responses.get('chest_pain_severity', 0))
+    except (ValueError, TypeError):
+        return 0
+
+# Scenario -> (ordered (predicate, condition) rules, condition when none match)
+CONDITION_RULES = {
+    EmergencyScenario.FALL: (
+        (
+            (lambda r: not r.get('consciousness'), "Critical - Unconscious"),
+            (lambda r: r.get('severe_injury') or r.get('head_injury_check'), "Serious - Potential major injury"),
+            (lambda r: not r.get('mobility_status'), "Moderate - Cannot move"),
+        ),
+        "Stable - Conscious and mobile"
+    ),
+    EmergencyScenario.INJURY: (
+        (
+            (lambda r: not r.get('consciousness'), "Critical - Unconscious"),
+            (lambda r: r.get('bleeding_severity') == 'Severe bleeding' or not r.get('breathing_status'), "Critical - Life threatening"),
+            (lambda r: r.get('bleeding_severity') == 'Moderate bleeding', "Serious - Significant injury"),
+        ),
+        "Stable - Minor injury"
+    ),
+    EmergencyScenario.CHEST_PAIN: (
+        (
+            (lambda r: not r.get('consciousness'), "Critical - Unconscious"),
+            (lambda r: _chest_pain_score(r) >= 8 or r.get('breathing_difficulty') or r.get('pain_radiation'), "Critical - Possible heart attack"),
+            (lambda r: _chest_pain_score(r) >= 6, "Serious - Significant chest pain"),
+        ),
+        "Moderate - Chest discomfort"
+    ),
+    EmergencyScenario.CONFUSION: (
+        (
+            (lambda r: not r.get('responsiveness'), "Critical - Unresponsive"),
+            (lambda r: r.get('physical_symptoms') or r.get('safety_concerns'), "Serious - Altered mental state with complications"),
+        ),
+        "Moderate - Confusion requiring evaluation"
+    ),
+    EmergencyScenario.GENERAL: (
+        (),
+        "Medical emergency requiring immediate attention"
+    )
+}
+
 # =============================================
 # Emergency Escalation Service
 # =============================================
@@ -96,12 +301,15 @@ class EmergencyEscalationService:
     def __init__(self):
         self.emergency_phone_number = os.environ.get('EMERGENCY_PHONE_NUMBER', '911')
         self.sns_topic_arn = os.environ.get('EMERGENCY_SNS_TOPIC_ARN')
+        # Topic with one SMS subscription per contact, filtered on the family_id attribute
+        self.fanout_topic_arn = os.environ.get('EMERGENCY_FANOUT_TOPIC_ARN')
+        self._can_notify = bool(self.fanout_topic_arn or self.sns_topic_arn)
         
     def initiate_emergency_call(self, request: EmergencyCallRequest, family_id: str) -> EmergencyCallResult:
         """Initiate emergency services call and notifications"""
         try:
-            call_id = f"EMERGENCY_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{request.alert_id[:8]}"
             start_time = datetime.utcnow()
+            call_id = f"EMERGENCY_{start_time.strftime('%Y%m%d_%H%M%S')}_{request.alert_id[:8]}"
             
             # Generate call script
             call_script = self.generate_call_script(request)
@@ -119,7 +327,7 @@ class EmergencyEscalationService:
             result = EmergencyCallResult(
                 call_id=call_id,
                 status=CallStatus.INITIATED if emergency_call_success else CallStatus.FAILED,
-                timestamp=datetime.utcnow().isoformat() + 'Z',
+                timestamp=start_time.isoformat() + 'Z',
                 emergency_services_called=emergency_call_success,
                 contacts_notified=contacts_notified,
                 call_script=call_script.primary_script,
@@ -127,11 +335,16 @@ class EmergencyEscalationService:
                 response_time_seconds=response_time
             )
             
-            # Log the emergency call
-            self._log_emergency_call(result, request, family_id)
-            
-            # Create timeline entry
-            self._create_emergency_timeline_entry(result, request, family_id)
+            # Log the emergency call and create the timeline entry before returning, since a
+            # frozen Lambda would drop any write still in flight. The call itself already
+            # happened, so a failed write is logged with the full record rather than failing it.
+            try:
+                self._write_emergency_audit(result, request, family_id)
+            except Exception as e:
+                logger.error(
+                    f"Error writing emergency audit records for {call_id}: {e}",
+                    extra={'emergency_log': self._build_emergency_log_item(result, request, family_id)}
+                )
             
             logger.info(f"Emergency call initiated: {call_id}")
             return result
@@ -140,10 +353,11 @@ class EmergencyEscalationService:
             logger.error(f"Error initiating emergency call: {e}")
             
             # Return failed result
+            failed_at = datetime.utcnow()
             return EmergencyCallResult(
-                call_id=f"EMERGENCY_FAILED_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                call_id=f"EMERGENCY_FAILED_{failed_at.strftime('%Y%m%d_%H%M%S')}",
                 status=CallStatus.FAILED,
-                timestamp=datetime.utcnow().isoformat() + 'Z',
+                timestamp=failed_at.isoformat() + 'Z',
                 emergency_services_called=False,
                 contacts_notified=[],
                 call_script="Emergency call failed",
@@ -152,29 +366,30 @@ class EmergencyEscalationService:
     
     def generate_call_script(self, request: EmergencyCallRequest) -> CallScript:
         """Generate appropriate call script based on scenario"""
-        scenario_generators = {
-            EmergencyScenario.FALL: self._generate_fall_call_script,
-            EmergencyScenario.INJURY: self._generate_injury_call_script,
-            EmergencyScenario.CHEST_PAIN: self._generate_chest_pain_call_script,
-            EmergencyScenario.CONFUSION: self._generate_confusion_call_script,
-            EmergencyScenario.GENERAL: self._generate_general_call_script
-        }
-        
-        generator = scenario_generators.get(request.scenario, self._generate_general_call_script)
-        return generator(request)
+        generator = self._SCENARIO_GENERATORS.get(request.scenario, self._SCENARIO_GENERATORS[EmergencyScenario.GENERAL])
+        return generator(self, request)
     
-    def get_emergency_contacts(self, family_id: str) -> List[EmergencyContact]:
-        """Get emergency contacts for a family"""
+    def get_emergency_contacts(self, family_id: str, fresh: bool = False) -> List[EmergencyContact]:
+        """Get emergency contacts for a family; `fresh` skips the contacts cache and DAX"""
+        if not fresh:
+            with _contacts_cache_lock:
+                cached = _contacts_cache.get(family_id)
+            if cached is not None:
+                return list(cached)
+        
         try:
-            response = table.query(
+            response = (table if fresh else read_table).query(
                 KeyConditionExpression='PK = :pk AND begins_with(SK, :sk)',
                 ExpressionAttributeValues={
                     ':pk': f'FAMILY#{family_id}',
                     ':sk': 'EMERGENCY_CONTACT#'
-                }
+                },
+                ProjectionExpression=CONTACT_PROJECTION,
+                ExpressionAttributeNames={'#n': 'name'}
             )
             
             contacts = []
+            has_emergency_services = False
             for item in response.get('Items', []):
                 contact = EmergencyContact(
                     id=item.get('contact_id'),
@@ -182,19 +397,25 @@ class EmergencyEscalationService:
                     phone=item.get('phone'),
                     relationship=item.get('relationship'),
                     priority=item.get('priority', 999),
-                    contact_type=ContactType(item.get('contact_type', 'family')),
+                    contact_type=_enum_from_value(CONTACT_TYPE_BY_VALUE, item.get('contact_type', 'family'), 'ContactType'),
                     is_available=item.get('is_available'),
                     last_contacted_at=item.get('last_contacted_at'),
-                    notification_preferences=item.get('notification_preferences', {})
+                    notification_preferences=item.get('notification_preferences', {}),
+                    created_at=item.get('created_at'),
+                    updated_at=item.get('updated_at')
                 )
                 contacts.append(contact)
+                has_emergency_services = has_emergency_services or contact.contact_type == ContactType.EMERGENCY_SERVICES
             
             # Sort by priority
-            contacts.sort(key=lambda x: x.priority)
+            contacts.sort(key=attrgetter('priority'))
             
             # Add default emergency services if not present
-            if not any(c.contact_type == ContactType.EMERGENCY_SERVICES for c in contacts):
-                contacts.insert(0, self._get_default_emergency_contact())
+            if not has_emergency_services:
+                contacts = [self._get_default_emergency_contact()] + contacts
+            
+            with _contacts_cache_lock:
+                _contacts_cache[family_id] = tuple(contacts)
             
             return contacts
             
@@ -205,26 +426,17 @@ class EmergencyEscalationService:
     def add_emergency_contact(self, contact: EmergencyContact, family_id: str) -> Dict[str, Any]:
         """Add or update emergency contact"""
         try:
-            contact_id = contact.id or f"EMERGENCY_CONTACT#{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}#{contact.name.replace(' ', '_')}"
-            
-            item = {
-                'PK': f'FAMILY#{family_id}',
-                'SK': f'EMERGENCY_CONTACT#{contact_id}',
-                'contact_id': contact_id,
-                'name': contact.name,
-                'phone': contact.phone,
-                'relationship': contact.relationship,
-                'priority': contact.priority,
-                'contact_type': contact.contact_type.value,
-                'is_available': contact.is_available,
-                'last_contacted_at': contact.last_contacted_at,
-                'notification_preferences': contact.notification_preferences or {},
-                'created_at': datetime.utcnow().isoformat() + 'Z',
-                'updated_at': datetime.utcnow().isoformat() + 'Z',
-                'entity_type': 'emergency_contact'
-            }
+            now = datetime.utcnow()
+            now_iso = now.isoformat() + 'Z'
+            contact_id = contact.id or f"EMERGENCY_CONTACT#{now.strftime('%Y%m%d_%H%M%S')}#{contact.name.replace(' ', '_')}"
+            
+            item = self._build_contact_item(
+                replace(contact, id=contact_id, created_at=now_iso, updated_at=now_iso),
+                family_id
+            )
             
             table.put_item(Item=item)
+            invalidate_contacts_cache(family_id)
             logger.info(f"Emergency contact added: {contact_id}")
             
             return item
@@ -237,7 +449,7 @@ class EmergencyEscalationService:
         """Test if emergency contact is available"""
         try:
             # Get contact
-            response = table.get_item(
+            response = read_table.get_item(
                 Key={
                     'PK': f'FAMILY#{family_id}',
                     'SK': f'EMERGENCY_CONTACT#{contact_id}'
@@ -251,8 +463,7 @@ class EmergencyEscalationService:
             
             # Simulate availability check (in production, this might ping the contact)
             # For now, assume 80% availability
-            import random
-            is_available = random.random() > 0.2
+            is_available = _chance(0.8)
             
             # Update contact with availability status
             table.update_item(
@@ -266,6 +477,7 @@ class EmergencyEscalationService:
                     ':timestamp': datetime.utcnow().isoformat() + 'Z'
                 }
             )
+            invalidate_contacts_cache(family_id)
             
             return is_available
             
@@ -289,8 +501,7 @@ class EmergencyEscalationService:
             logger.info(f"Call script: {call_script.primary_script}")
             
             # Simulate 95% success rate
-            import random
-            return random.random() > 0.05
+            return _chance(0.95)
             
         except Exception as e:
             logger.error(f"Error in emergency call simulation: {e}")
@@ -298,49 +509,127 @@ class EmergencyEscalationService:
     
     def _notify_emergency_contacts(self, request: EmergencyCallRequest, family_id: str, call_script: CallScript) -> List[str]:
         """Notify emergency contacts via SMS/push notifications"""
+        if not self._can_notify:
+            logger.warning("SNS not configured; skipping emergency contact notifications")
+            return []
+        
         notified_contacts = []
         
         try:
-            contacts = self.get_emergency_contacts(family_id)
+            # Read contacts fresh so an edited phone number takes effect immediately
+            contacts = self.get_emergency_contacts(family_id, fresh=True)
             
             # Notify top 5 priority contacts (excluding emergency services)
             contacts_to_notify = [c for c in contacts if c.contact_type != ContactType.EMERGENCY_SERVICES][:5]
             
-            for contact in contacts_to_notify:
-                try:
-                    message = self._generate_notification_message(request, contact, call_script)
-                    
-                    if self.sns_topic_arn and contact.phone:
-                        # Send SMS notification
-                        sns.publish(
-                            PhoneNumber=contact.phone,
-                            Message=message
-                        )
-                        logger.info(f"SMS sent to {contact.name} ({contact.phone})")
-                    
-                    # Update last contacted timestamp
-                    table.update_item(
-                        Key={
+            # The message does not vary per contact, so build it (and its timestamp) once
+            message = self._generate_notification_message(request, call_script)
+            
+            if self.fanout_topic_arn:
+                # One publish; SNS delivers it to every subscribed contact of the family
+                self._publish_fanout_notification(request, family_id, message)
+                reached_contacts = contacts_to_notify
+            else:
+                reached_contacts = self._publish_contact_notifications(contacts_to_notify, message)
+            
+            notified_contacts = [contact.id for contact in reached_contacts]
+            
+            # Record last contacted time in one write, after the notifications are out
+            try:
+                self._record_contacts_notified(reached_contacts, family_id)
+            except Exception as e:
+                logger.error(f"Error updating last contacted time for emergency contacts: {e}")
+            
+        except Exception as e:
+            logger.error(f"Error notifying emergency contacts: {e}")
+        
+        return notified_contacts
+    
+    def _record_contacts_notified(self, contacts: List[EmergencyContact], family_id: str) -> None:
+        """Set last_contacted_at on notified contacts with a single transactional write"""
+        if not contacts:
+            return
+        
+        timestamp = datetime.utcnow().isoformat() + 'Z'
+        
+        # Only touch last_contacted_at so concurrent edits to the contacts are kept
+        table.meta.client.transact_write_items(
+            TransactItems=[
+                {
+                    'Update': {
+                        'TableName': TABLE_NAME,
+                        'Key': {
                             'PK': f'FAMILY#{family_id}',
                             'SK': f'EMERGENCY_CONTACT#{contact.id}'
                         },
-                        UpdateExpression='SET last_contacted_at = :timestamp',
-                        ExpressionAttributeValues={
-                            ':timestamp': datetime.utcnow().isoformat() + 'Z'
-                        }
-                    )
-                    
-                    notified_contacts.append(contact.id)
-                    
+                        'UpdateExpression': 'SET last_contacted_at = :timestamp',
+                        'ExpressionAttributeValues': {':timestamp': timestamp}
+                    }
+                }
+                for contact in contacts
+            ]
+        )
+        invalidate_contacts_cache(family_id)
+    
+    def _build_contact_item(self, contact: EmergencyContact, family_id: str) -> Dict[str, Any]:
+        """Build the DynamoDB item for an emergency contact"""
+        return {
+            'PK': f'FAMILY#{family_id}',
+            'SK': f'EMERGENCY_CONTACT#{contact.id}',
+            'contact_id': contact.id,
+            'name': contact.name,
+            'phone': contact.phone,
+            'relationship': contact.relationship,
+            'priority': contact.priority,
+            'contact_type': contact.contact_type.value,
+            'is_available': contact.is_available,
+            'last_contacted_at': contact.last_contacted_at,
+            'notification_preferences': contact.notification_preferences or {},
+            'created_at': contact.created_at,
+            'updated_at': contact.updated_at,
+            'entity_type': 'emergency_contact'
+        }
+    
+    def _publish_contact_notifications(self, contacts: List[EmergencyContact], message: str) -> List[EmergencyContact]:
+        """Send per-contact SMS notifications concurrently, returning contacts not failed"""
+        sms_contacts = [c for c in contacts if c.phone]
+        failed_ids = set()
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(
+                    sns.publish,
+                    PhoneNumber=contact.phone,
+                    Message=message
+                ): contact
+                for contact in sms_contacts
+            }
+            
+            for future in as_completed(futures):
+                contact = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"SMS sent to {contact.name} ({contact.phone})")
                 except Exception as e:
+                    failed_ids.add(contact.id)
                     logger.error(f"Error notifying contact {contact.name}: {e}")
-            
-        except Exception as e:
-            logger.error(f"Error notifying emergency contacts: {e}")
         
-        return notified_contacts
+        return [c for c in contacts if c.id not in failed_ids]
+    
+    def _publish_fanout_notification(self, request: EmergencyCallRequest, family_id: str, message: str) -> None:
+        """Publish a single emergency notification to the fan-out topic"""
+        sns.publish(
+            TopicArn=self.fanout_topic_arn,
+            Message=message,
+            MessageAttributes={
+                'family_id': {'DataType': 'String', 'StringValue': family_id},
+                'scenario': {'DataType': 'String', 'StringValue': request.scenario.value},
+                'urgency': {'DataType': 'Number', 'StringValue': str(request.urgency_level)}
+            }
+        )
+        logger.info(f"Emergency notification published to fan-out topic for family {family_id}")
     
-    def _generate_notification_message(self, request: EmergencyCallRequest, contact: EmergencyContact, call_script: CallScript) -> str:
+    def _generate_notification_message(self, request: EmergencyCallRequest, call_script: CallScript) -> str:
         """Generate notification message for emergency contacts"""
         timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
         
@@ -367,34 +656,35 @@ class EmergencyEscalationService:
         head_injury = responses.get('head_injury_check')
         mobility = responses.get('mobility_status')
         
-        key_info = [
-            f"Patient: {elder_name}",
-            f"Incident: Fall",
-            f"Conscious: {'Yes' if consciousness else 'No'}",
-            f"Severe injury: {'Yes' if severe_injury else 'No'}",
-            f"Pain level: {pain_level}/10",
-            f"Head injury: {'Yes' if head_injury else 'No'}",
-            f"Can move: {'Yes' if mobility else 'No'}"
-        ]
+        key_info = _render_key_info(FALL_KEY_INFO, {
+            'elder_name': elder_name,
+            'consciousness': _yes_no(consciousness),
+            'severe_injury': _yes_no(severe_injury),
+            'pain_level': pain_level,
+            'head_injury': _yes_no(head_injury),
+            'mobility': _yes_no(mobility)
+        })
         
-        primary_script = f"This is a medical emergency. An elderly person named {elder_name} has fallen. "
+        parts = [FALL_SCRIPT_PREFIX.format(elder_name=elder_name)]
         
         if not consciousness:
-            primary_script += "The person is unconscious. "
+            parts.append("The person is unconscious. ")
         if severe_injury:
-            primary_script += "There are signs of severe injury. "
+            parts.append("There are signs of severe injury. ")
         if head_injury:
-            primary_script += "There may be a head injury. "
+            parts.append("There may be a head injury. ")
         if not mobility:
-            primary_script += "The person cannot move. "
+            parts.append("The person cannot move. ")
             
-        primary_script += f"Please send an ambulance immediately to {location}."
+        parts.append(AMBULANCE_REQUEST.format(location=location))
+        
+        primary_script = ''.join(parts)
         
         return CallScript(
             scenario='fall',
             primary_script=primary_script,
             key_information=key_info,
-            current_condition=self._assess_fall_condition(responses),
+            current_condition=self._assess_condition(EmergencyScenario.FALL, responses),
             location=location,
             callback_number="Callback number to be provided"
         )
@@ -411,33 +701,34 @@ class EmergencyEscalationService:
         pain_level = responses.get('pain_scale', 'unknown')
         injury_location = responses.get('injury_location', 'unknown')
         
-        key_info = [
-            f"Patient: {elder_name}",
-            f"Incident: Injury",
-            f"Conscious: {'Yes' if consciousness else 'No'}",
-            f"Bleeding: {bleeding}",
-            f"Breathing normal: {'Yes' if breathing else 'No'}",
-            f"Pain level: {pain_level}/10",
-            f"Injury location: {injury_location}"
-        ]
+        key_info = _render_key_info(INJURY_KEY_INFO, {
+            'elder_name': elder_name,
+            'consciousness': _yes_no(consciousness),
+            'bleeding': bleeding,
+            'breathing': _yes_no(breathing),
+            'pain_level': pain_level,
+            'injury_location': injury_location
+        })
         
-        primary_script = f"This is a medical emergency. An elderly person named {elder_name} has sustained an injury. "
+        parts = [INJURY_SCRIPT_PREFIX.format(elder_name=elder_name)]
         
         if not consciousness:
-            primary_script += "The person is unconscious. "
+            parts.append("The person is unconscious. ")
         if bleeding == 'Severe bleeding':
-            primary_script += "There is severe bleeding. "
+            parts.append("There is severe bleeding. ")
         if not breathing:
-            primary_script += "The person is having difficulty breathing. "
+            parts.append("The person is having difficulty breathing. ")
             
-        primary_script += f"The injury is located at {injury_location}. "
-        primary_script += f"Please send an ambulance immediately to {location}."
+        parts.append(f"The injury is located at {injury_location}. ")
+        parts.append(AMBULANCE_REQUEST.format(location=location))
+        
+        primary_script = ''.join(parts)
         
         return CallScript(
             scenario='injury',
             primary_script=primary_script,
             key_information=key_info,
-            current_condition=self._assess_injury_condition(responses),
+            current_condition=self._assess_condition(EmergencyScenario.INJURY, responses),
             location=location,
             callback_number="Callback number to be provided"
         )
@@ -455,39 +746,40 @@ class EmergencyEscalationService:
         pain_radiation = responses.get('pain_radiation')
         cardiac_history = responses.get('cardiac_history')
         
-        key_info = [
-            f"Patient: {elder_name}",
-            f"Incident: Chest Pain",
-            f"Conscious: {'Yes' if consciousness else 'No'}",
-            f"Pain severity: {pain_severity}/10",
-            f"Breathing difficulty: {'Yes' if breathing_difficulty else 'No'}",
-            f"Sweating/nausea: {'Yes' if sweating_nausea else 'No'}",
-            f"Pain radiating: {'Yes' if pain_radiation else 'No'}",
-            f"Cardiac history: {'Yes' if cardiac_history else 'No'}"
-        ]
+        key_info = _render_key_info(CHEST_PAIN_KEY_INFO, {
+            'elder_name': elder_name,
+            'consciousness': _yes_no(consciousness),
+            'pain_severity': pain_severity,
+            'breathing_difficulty': _yes_no(breathing_difficulty),
+            'sweating_nausea': _yes_no(sweating_nausea),
+            'pain_radiation': _yes_no(pain_radiation),
+            'cardiac_history': _yes_no(cardiac_history)
+        })
         
-        primary_script = f"This is a medical emergency. An elderly person named {elder_name} is experiencing severe chest pain. "
+        parts = [CHEST_PAIN_SCRIPT_PREFIX.format(elder_name=elder_name)]
         
         if not consciousness:
-            primary_script += "The person is unconscious. "
+            parts.append("The person is unconscious. ")
         if breathing_difficulty:
-            primary_script += "There is difficulty breathing. "
+            parts.append("There is difficulty breathing. ")
         if sweating_nausea:
-            primary_script += "The person is sweating and nauseous. "
+            parts.append("The person is sweating and nauseous. ")
         if pain_radiation:
-            primary_script += "The pain is radiating to arm, jaw, or back. "
+            parts.append("The pain is radiating to arm, jaw, or back. ")
         if cardiac_history:
-            primary_script += "The person has a history of heart problems. "
+            parts.append("The person has a history of heart problems. ")
             
-        primary_script += "This may be a heart attack. "
-        primary_script += f"Please send an ambulance immediately to {location}."
+        parts.append("This may be a heart attack. ")
+        parts.append(AMBULANCE_REQUEST.format(location=location))
+        
+        primary_script = ''.join(parts)
         
         return CallScript(
             scenario='chest_pain',
             primary_script=primary_script,
             key_information=key_info,
             medical_history="History of cardiac problems" if cardiac_history else "No known cardiac history",
-            current_condition=self._assess_chest_pain_condition(responses),
+            current_condition=self._assess_condition(EmergencyScenario.CHEST_PAIN, responses),
             location=location,
             callback_number="Callback number to be provided"
         )
@@ -504,33 +796,34 @@ class EmergencyEscalationService:
         confusion_onset = responses.get('confusion_onset', 'unknown')
         safety_concerns = responses.get('safety_concerns')
         
-        key_info = [
-            f"Patient: {elder_name}",
-            f"Incident: Confusion/Altered Mental State",
-            f"Responsive: {'Yes' if responsiveness else 'No'}",
-            f"Orientation: {orientation}",
-            f"Physical symptoms: {'Yes' if physical_symptoms else 'No'}",
-            f"Onset: {confusion_onset}",
-            f"Safety concerns: {'Yes' if safety_concerns else 'No'}"
-        ]
+        key_info = _render_key_info(CONFUSION_KEY_INFO, {
+            'elder_name': elder_name,
+            'responsiveness': _yes_no(responsiveness),
+            'orientation': orientation,
+            'physical_symptoms': _yes_no(physical_symptoms),
+            'confusion_onset': confusion_onset,
+            'safety_concerns': _yes_no(safety_concerns)
+        })
         
-        primary_script = f"This is a medical emergency. An elderly person named {elder_name} is experiencing severe confusion or altered mental state. "
+        parts = [CONFUSION_SCRIPT_PREFIX.format(elder_name=elder_name)]
         
         if not responsiveness:
-            primary_script += "The person is not responsive to voice or touch. "
+            parts.append("The person is not responsive to voice or touch. ")
         if physical_symptoms:
-            primary_script += "There are physical symptoms present. "
+            parts.append("There are physical symptoms present. ")
         if safety_concerns:
-            primary_script += "There are immediate safety concerns. "
+            parts.append("There are immediate safety concerns. ")
             
-        primary_script += f"The confusion started {confusion_onset}. "
-        primary_script += f"Please send an ambulance immediately to {location}."
+        parts.append(f"The confusion started {confusion_onset}. ")
+        parts.append(AMBULANCE_REQUEST.format(location=location))
+        
+        primary_script = ''.join(parts)
         
         return CallScript(
             scenario='confusion',
             primary_script=primary_script,
             key_information=key_info,
-            current_condition=self._assess_confusion_condition(responses),
+            current_condition=self._assess_condition(EmergencyScenario.CONFUSION, responses),
             location=location,
             callback_number="Callback number to be provided"
         )
@@ -540,84 +833,41 @@ class EmergencyEscalationService:
         elder_name = request.elder_name
         location = request.location or "Location to be determined"
         
-        key_info = [
-            f"Patient: {elder_name}",
-            f"Incident: Medical Emergency",
-            f"Location: {location}"
-        ]
+        key_info = _render_key_info(GENERAL_KEY_INFO, {
+            'elder_name': elder_name,
+            'location': location
+        })
+        
+        parts = [GENERAL_SCRIPT_PREFIX.format(elder_name=elder_name)]
+        parts.append(AMBULANCE_REQUEST.format(location=location))
         
-        primary_script = f"This is a medical emergency involving an elderly person named {elder_name}. "
-        primary_script += f"Please send an ambulance immediately to {location}."
+        primary_script = ''.join(parts)
         
         return CallScript(
             scenario='general',
             primary_script=primary_script,
             key_information=key_info,
-            current_condition="Medical emergency requiring immediate attention",
+            current_condition=self._assess_condition(EmergencyScenario.GENERAL, {}),
             location=location,
             callback_number="Callback number to be provided"
         )
     
-    def _assess_fall_condition(self, responses: Dict[str, Any]) -> str:
-        """Assess fall condition severity"""
-        consciousness = responses.get('consciousness')
-        severe_injury = responses.get('severe_injury')
-        head_injury = responses.get('head_injury_check')
-        mobility = responses.get('mobility_status')
-        
-        if not consciousness:
-            return "Critical - Unconscious"
-        if severe_injury or head_injury:
-            return "Serious - Potential major injury"
-        if not mobility:
-            return "Moderate - Cannot move"
-        return "Stable - Conscious and mobile"
+    # Built once at class definition; generators are plain functions called with self
+    _SCENARIO_GENERATORS = {
+        EmergencyScenario.FALL: _generate_fall_call_script,
+        EmergencyScenario.INJURY: _generate_injury_call_script,
+        EmergencyScenario.CHEST_PAIN: _generate_chest_pain_call_script,
+        EmergencyScenario.CONFUSION: _generate_confusion_call_script,
+        EmergencyScenario.GENERAL: _generate_general_call_script
+    }
     
-    def _assess_injury_condition(self, responses: Dict[str, Any]) -> str:
-        """Assess injury condition severity"""
-        consciousness = responses.get('consciousness')
-        bleeding = responses.get('bleeding_severity')
-        breathing = responses.get('breathing_status')
-        
-        if not consciousness:
-            return "Critical - Unconscious"
-        if bleeding == 'Severe bleeding' or not breathing:
-            return "Critical - Life threatening"
-        if bleeding == 'Moderate bleeding':
-            return "Serious - Significant injury"
-        return "Stable - Minor injury"
-    
-    def _assess_chest_pain_condition(self, responses: Dict[str, Any]) -> str:
-        """Assess chest pain condition severity"""
-        consciousness = responses.get('consciousness')
-        pain_severity = responses.get('chest_pain_severity', 0)
-        breathing_difficulty = responses.get('breathing_difficulty')
-        pain_radiation = responses.get('pain_radiation')
-        
-        try:
-            pain_severity = float(pain_severity)
-        except (ValueError, TypeError):
-            pain_severity = 0
-        
-        if not consciousness:
-            return "Critical - Unconscious"
-        if pain_severity >= 8 or breathing_difficulty or pain_radiation:
-            return "Critical - Possible heart attack"
-        if pain_severity >= 6:
-            return "Serious - Significant chest pain"
-        return "Moderate - Chest discomfort"
-    
-    def _assess_confusion_condition(self, responses: Dict[str, Any]) -> str:
-        """Assess confusion condition severity"""
-        responsiveness = responses.get('responsiveness')
-        physical_symptoms = responses.get('physical_symptoms')
-        safety_concerns = responses.get('safety_concerns')
-        
-        if not responsiveness:
-            return "Critical - Unresponsive"
-        if physical_symptoms or safety_concerns:
-            return "Serious - Altered mental state with complications"
-        return "Moderate - Confusion requiring evaluation"
+    def _assess_condition(self, scenario: EmergencyScenario, responses: Dict[str, Any]) -> str:
+        """Assess condition severity from the first matching scenario rule"""
+        rules, default_condition = CONDITION_RULES.get(scenario, CONDITION_RULES[EmergencyScenario.GENERAL])
+        for predicate, condition in rules:
+            if predicate(responses):
+                return condition
+        return default_condition
     
     def _get_default_emergency_contact(self) -> EmergencyContact:
         """Get default emergency services contact"""
@@ -631,84 +881,83 @@ class EmergencyEscalationService:
             is_available=True
         )
     
-    def _log_emergency_call(self, result: EmergencyCallResult, request: EmergencyCallRequest, family_id: str) -> None:
-        """Log emergency call for audit trail"""
-        try:
-            log_entry = {
-                'PK': f'FAMILY#{family_id}',
-                'SK': f'EMERGENCY_LOG#{result.call_id}',
-                'call_id': result.call_id,
-                'alert_id': request.alert_id,
-                'elder_id': request.elder_id,
-                'elder_name': request.elder_name,
-                'scenario': request.scenario.value,
-                'status': result.status.value,
-                'emergency_services_called': result.emergency_services_called,
-                'contacts_notified_count': len(result.contacts_notified),
-                'contacts_notified': result.contacts_notified,
-                'urgency_level': request.urgency_level,
-                'location': result.location,
-                'response_time_seconds': result.response_time_seconds,
-                'call_script': result.call_script,
-                'timestamp': result.timestamp,
-                'requested_by': request.requested_by,
-                'entity_type': 'emergency_log'
-            }
-            
-            table.put_item(Item=log_entry)
-            logger.info(f"Emergency call logged: {result.call_id}")
-            
-        except Exception as e:
-            logger.error(f"Error logging emergency call: {e}")
+    def _write_emergency_audit(self, result: EmergencyCallResult, request: EmergencyCallRequest, family_id: str) -> None:
+        """Write the emergency call log and timeline entry in one batch"""
+        log_item = self._build_emergency_log_item(result, request, family_id)
+        timeline_item = self._build_emergency_timeline_item(result, request, family_id)
+        
+        with table.batch_writer() as batch:
+            batch.put_item(Item=log_item)
+            batch.put_item(Item=timeline_item)
+        
+        logger.info(f"Emergency call logged: {result.call_id}")
+        logger.info(f"Emergency timeline entry created: {timeline_item['timeline_id']}")
     
-    def _create_emergency_timeline_entry(self, result: EmergencyCallResult, request: EmergencyCallRequest, family_id: str) -> None:
-        """Create timeline entry for emergency call"""
-        try:
-            timeline_id = f"TIMELINE#{result.call_id}#{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-            
-            timeline_entry = {
-                'PK': f'FAMILY#{family_id}',
-                'SK': timeline_id,
-                'GSI1PK': f'ELDER#{request.elder_id}',
-                'GSI1SK': result.timestamp,
-                'GSI2PK': f'TIMELINE#{family_id}',
-                'GSI2SK': result.timestamp,
-                'timeline_id': timeline_id,
-                'elder_id': request.elder_id,
-                'event_type': 'emergency_call_initiated',
-                'participants': [request.requested_by] if request.requested_by else [],
-                'event_data': {
-                    'summary': f'Emergency services called for {request.elder_name}',
-                    'details': {
-                        'call_id': result.call_id,
-                        'scenario': request.scenario.value,
-                        'emergency_services_called': result.emergency_services_called,
-                        'contacts_notified': len(result.contacts_notified),
-                        'location': result.location,
-                        'urgency_level': request.urgency_level
-                    },
-                    'outcomes': [
-                        {
-                            'type': 'emergency_response',
-                            'description': f'Emergency call {"successful" if result.emergency_services_called else "failed"}',
-                            'evidence': [],
-                            'followUpRequired': True
-                        }
-                    ],
-                    'evidence': []
+    def _build_emergency_log_item(self, result: EmergencyCallResult, request: EmergencyCallRequest, family_id: str) -> Dict[str, Any]:
+        """Build the audit trail item for an emergency call"""
+        return {
+            'PK': f'FAMILY#{family_id}',
+            'SK': f'EMERGENCY_LOG#{result.call_id}',
+            'call_id': result.call_id,
+            'alert_id': request.alert_id,
+            'elder_id': request.elder_id,
+            'elder_name': request.elder_name,
+            'scenario': request.scenario.value,
+            'status': result.status.value,
+            'emergency_services_called': result.emergency_services_called,
+            'contacts_notified_count': len(result.contacts_notified),
+            'contacts_notified': result.contacts_notified,
+            'urgency_level': request.urgency_level,
+            'location': result.location,
+            'response_time_seconds': result.response_time_seconds,
+            'call_script': result.call_script,
+            'timestamp': result.timestamp,
+            'requested_by': request.requested_by,
+            'entity_type': 'emergency_log'
+        }
+    
+    def _build_emergency_timeline_item(self, result: EmergencyCallResult, request: EmergencyCallRequest, family_id: str) -> Dict[str, Any]:
+        """Build the timeline item for an emergency call"""
+        # Reuse the call timestamp (YYYY-MM-DDTHH:MM:SS...) as YYYYMMDD_HHMMSS
+        timeline_id = f"TIMELINE#{result.call_id}#{result.timestamp[:19].replace('-', '').replace(':', '').replace('T', '_')}"
+        
+        return {
+            'PK': f'FAMILY#{family_id}',
+            'SK': timeline_id,
+            'GSI1PK': f'ELDER#{request.elder_id}',
+            'GSI1SK': result.timestamp,
+            'GSI2PK': f'TIMELINE#{family_id}',
+            'GSI2SK': result.timestamp,
+            'timeline_id': timeline_id,
+            'elder_id': request.elder_id,
+            'event_type': 'emergency_call_initiated',
+            'participants': [request.requested_by] if request.requested_by else [],
+            'event_data': {
+                'summary': f'Emergency services called for {request.elder_name}',
+                'details': {
+                    'call_id': result.call_id,
+                    'scenario': request.scenario.value,
+                    'emergency_services_called': result.emergency_services_called,
+                    'contacts_notified': len(result.contacts_notified),
+                    'location': result.location,
+                    'urgency_level': request.urgency_level
                 },
-                'immutable': True,
-                'created_by': request.requested_by or 'system',
-                'occurred_at': result.timestamp,
-                'related_items': [request.alert_id],
-                'entity_type': 'timeline'
-            }
-            
-            table.put_item(Item=timeline_entry)
-            logger.info(f"Emergency timeline entry created: {timeline_id}")
-            
-        except Exception as e:
-            logger.error(f"Error creating emergency timeline entry: {e}")
+                'outcomes': [
+                    {
+                        'type': 'emergency_response',
+                        'description': f'Emergency call {"successful" if result.emergency_services_called else "failed"}',
+                        'evidence': [],
+                        'followUpRequired': True
+                    }
+                ],
+                'evidence': []
+            },
+            'immutable': True,
+            'created_by': request.requested_by or 'system',
+            'occurred_at': result.timestamp,
+            'related_items': [request.alert_id],
+            'entity_type': 'timeline'
+        }
 
 # =============================================
 # Utility Functions
@@ -737,7 +986,7 @@ def initiate_emergency_call(
         alert_id=alert_id,
         elder_id=elder_id,
         elder_name=elder_name,
-        scenario=EmergencyScenario(scenario),
+        scenario=_enum_from_value(SCENARIO_BY_VALUE, scenario, 'EmergencyScenario'),
         urgency_level=urgency_level,
         location=location,
         triage_responses=triage_responses,
@@ -748,7 +997,7 @@ def initiate_emergency_call(
     
     return {
         'success': result.status != CallStatus.FAILED,
-        'data': asdict(result),
+        'data': result.to_dict(),
         'message': f'Emergency call {"initiated" if result.emergency_services_called else "failed"}'
     }
 
@@ -757,7 +1006,7 @@ def get_emergency_contacts_for_family(family_id: str) -> List[Dict[str, Any]]:
     service = create_emergency_escalation_service()
     contacts = service.get_emergency_contacts(family_id)
     
-    return [asdict(contact) for contact in contacts]
+    return [contact.to_dict() for contact in contacts]
 
 def add_emergency_contact_to_family(
     family_id: str,
@@ -776,7 +1025,7 @@ def add_emergency_contact_to_family(
         phone=phone,
         relationship=relationship,
         priority=priority,
-        contact_type=ContactType(contact_type)
+        contact_type=_enum_from_value(CONTACT_TYPE_BY_VALUE, contact_type, 'ContactType')
     )
     
     result = service.add_emergency_contact(contact, family_id)
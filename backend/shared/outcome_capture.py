@@ -3,15 +3,44 @@ Outcome Capture Service - Backend Implementation
 Handles outcome documentation, follow-up task generation, and timeline entry creation
 """
 
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 from enum import Enum
-import uuid
+import secrets
 
-from aws_lambda_powertools import Logger
+_logger = None
 
-logger = Logger()
+def _get_logger():
+    """Create the Powertools logger on first use, keeping it off the import path"""
+    global _logger
+    if _logger is None:
+        from aws_lambda_powertools import Logger
+        _logger = Logger()
+    return _logger
+
+# Pool of random 8-hex-char ID suffixes, refilled from one CSPRNG read per batch
+ID_POOL_SIZE = 256
+_id_pool: List[str] = []
+
+def _refill_id_pool() -> None:
+    """Refill the ID suffix pool from a single random read"""
+    raw = secrets.token_bytes(4 * ID_POOL_SIZE).hex()
+    _id_pool.extend(raw[i:i + 8] for i in range(0, len(raw), 8))
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+def _acquire_id_suffix() -> str:
+    """Take a random 8-hex-char suffix for timeline and outcome IDs"""
+    try:
+        return _id_pool.pop()
+    except IndexError:
+        _refill_id_pool()
+        return _id_pool.pop()
 
 # =============================================
 # Enums and Data Classes
@@ -30,29 +59,41 @@ class EvidenceType(Enum):
     DOCUMENTS = "documents"
     TIMESTAMP = "timestamp"
 
-@dataclass
-class Evidence:
+class Evidence(NamedTuple):
     type: str
     data: str
     timestamp: str
     description: Optional[str] = None
 
-@dataclass
-class FollowUpRule:
+class FollowUpRule(NamedTuple):
     outcome_condition: str
-    follow_up_task_template: Dict[str, Any]
+    follow_up_task_template: Mapping[str, Any]
     due_in_hours: float
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutcomeTemplateDefinition:
     template_type: OutcomeTemplateType
     title: str
     description: str
-    outcome_options: List[str]
-    follow_up_rules: List[FollowUpRule]
-    evidence_types: List[str]
+    outcome_options: Tuple[str, ...]
+    follow_up_rules: Tuple[FollowUpRule, ...]
+    evidence_types: Tuple[str, ...]
+    rules_by_condition: Mapping[str, FollowUpRule] = field(init=False, repr=False, compare=False)
+    outcome_options_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Templates are cached and shared across invocations, so store everything read-only
+        object.__setattr__(self, 'outcome_options', tuple(self.outcome_options))
+        object.__setattr__(self, 'follow_up_rules', tuple(self.follow_up_rules))
+        object.__setattr__(self, 'evidence_types', tuple(self.evidence_types))
+        object.__setattr__(self, 'outcome_options_set', frozenset(self.outcome_options))
+        # Conditions are exact outcome matches, so index rules by condition (first rule wins)
+        rules_by_condition = {}
+        for rule in self.follow_up_rules:
+            rules_by_condition.setdefault(rule.outcome_condition, rule)
+        object.__setattr__(self, 'rules_by_condition', MappingProxyType(rules_by_condition))
 
-@dataclass
+@dataclass(slots=True)
 class CapturedOutcome:
     action_taken: str
     emergency_services_called: bool
@@ -61,7 +102,7 @@ class CapturedOutcome:
     follow_up_required: bool
     next_check_in: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class TimelineEntry:
     id: str
     family_id: str
@@ -76,10 +117,185 @@ class TimelineEntry:
     created_at: str = None
     updated_at: str = None
 
+# =============================================
+# Follow-up Task Templates
+# =============================================
+
+def _freeze_task(task: Dict[str, Any]) -> Mapping[str, Any]:
+    """Make a follow-up task template read-only"""
+    return MappingProxyType({
+        **task,
+        'checklist': tuple(MappingProxyType(item) for item in task['checklist'])
+    })
+
+def _thaw_task(task: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a read-only follow-up task template into plain, JSON-ready dicts"""
+    return {**task, 'checklist': [dict(item) for item in task['checklist']]}
+
+MEDICATION_MISSED_DOSES_TASK = _freeze_task({
+    "title": "Follow up on missed medication doses",
+    "description": "Contact elder to understand why doses were missed and reschedule",
+    "priority": "high",
+    "estimatedMinutes": 15,
+    "checklist": [
+        {"text": "Contact elder about missed doses", "required": True},
+        {"text": "Understand reason for missing doses", "required": True},
+        {"text": "Reschedule missed doses if appropriate", "required": True},
+        {"text": "Document reason in notes", "required": False}
+    ],
+    "dueInHours": 4
+})
+
+MEDICATION_REFUSED_TASK = _freeze_task({
+    "title": "Investigate medication refusal",
+    "description": "Understand why elder is refusing medication and escalate if needed",
+    "priority": "high",
+    "estimatedMinutes": 20,
+    "checklist": [
+        {"text": "Ask about side effects or concerns", "required": True},
+        {"text": "Contact primary care physician if needed", "required": True},
+        {"text": "Document refusal reason", "required": True}
+    ],
+    "dueInHours": 2
+})
+
+MEDICATION_UNVERIFIED_TASK = _freeze_task({
+    "title": "Escalate medication verification issue",
+    "description": "Unable to verify medication status - escalate to primary caregiver",
+    "priority": "urgent",
+    "estimatedMinutes": 10,
+    "checklist": [
+        {"text": "Contact primary caregiver", "required": True},
+        {"text": "Provide context about verification issue", "required": True}
+    ],
+    "dueInHours": 1
+})
+
+SAFETY_MINOR_ISSUES_TASK = _freeze_task({
+    "title": "Address minor safety issues",
+    "description": "Implement solutions for identified minor safety concerns",
+    "priority": "medium",
+    "estimatedMinutes": 30,
+    "checklist": [
+        {"text": "Identify specific safety issues", "required": True},
+        {"text": "Implement corrective measures", "required": True},
+        {"text": "Verify improvements", "required": True}
+    ],
+    "dueInHours": 24
+})
+
+SAFETY_MAJOR_CONCERNS_TASK = _freeze_task({
+    "title": "Address major safety concerns",
+    "description": "Urgent action needed to address major safety concerns",
+    "priority": "urgent",
+    "estimatedMinutes": 60,
+    "checklist": [
+        {"text": "Document all safety concerns", "required": True},
+        {"text": "Contact family members", "required": True},
+        {"text": "Implement immediate safety measures", "required": True},
+        {"text": "Consider professional assessment", "required": True}
+    ],
+    "dueInHours": 2
+})
+
+SAFETY_INTERVENTION_TASK = _freeze_task({
+    "title": "Emergency safety intervention",
+    "description": "Immediate action required for critical safety issue",
+    "priority": "urgent",
+    "estimatedMinutes": 15,
+    "checklist": [
+        {"text": "Ensure elder safety immediately", "required": True},
+        {"text": "Contact emergency services if needed", "required": True},
+        {"text": "Notify all family members", "required": True}
+    ],
+    "dueInHours": 0.5
+})
+
+APPOINTMENT_COMPLETED_TASK = _freeze_task({
+    "title": "Document appointment results",
+    "description": "Collect and document results from completed appointment",
+    "priority": "medium",
+    "estimatedMinutes": 20,
+    "checklist": [
+        {"text": "Collect appointment summary from elder", "required": True},
+        {"text": "Document any new medications or instructions", "required": True},
+        {"text": "Schedule any recommended follow-ups", "required": True}
+    ],
+    "dueInHours": 4
+})
+
+APPOINTMENT_RESCHEDULED_TASK = _freeze_task({
+    "title": "Confirm rescheduled appointment",
+    "description": "Confirm new appointment date and time with elder",
+    "priority": "medium",
+    "estimatedMinutes": 10,
+    "checklist": [
+        {"text": "Confirm new appointment date/time", "required": True},
+        {"text": "Update calendar", "required": True},
+        {"text": "Arrange transportation if needed", "required": True}
+    ],
+    "dueInHours": 24
+})
+
+APPOINTMENT_REFUSED_TASK = _freeze_task({
+    "title": "Follow up on appointment refusal",
+    "description": "Understand why elder refused appointment and escalate if needed",
+    "priority": "high",
+    "estimatedMinutes": 20,
+    "checklist": [
+        {"text": "Understand reason for refusal", "required": True},
+        {"text": "Contact physician if medically necessary", "required": True},
+        {"text": "Document refusal and reason", "required": True}
+    ],
+    "dueInHours": 4
+})
+
+GENERAL_PARTIAL_TASK = _freeze_task({
+    "title": "Complete remaining task items",
+    "description": "Complete the remaining items from the original task",
+    "priority": "medium",
+    "estimatedMinutes": 30,
+    "checklist": [
+        {"text": "Review what was not completed", "required": True},
+        {"text": "Complete remaining items", "required": True},
+        {"text": "Verify completion", "required": True}
+    ],
+    "dueInHours": 24
+})
+
+GENERAL_NOT_COMPLETED_TASK = _freeze_task({
+    "title": "Retry incomplete task",
+    "description": "Attempt to complete the task again",
+    "priority": "high",
+    "estimatedMinutes": 30,
+    "checklist": [
+        {"text": "Understand reason for non-completion", "required": True},
+        {"text": "Address any barriers", "required": True},
+        {"text": "Retry task completion", "required": True}
+    ],
+    "dueInHours": 12
+})
+
+GENERAL_ESCALATED_TASK = _freeze_task({
+    "title": "Handle escalated task",
+    "description": "Task has been escalated and requires attention",
+    "priority": "urgent",
+    "estimatedMinutes": 20,
+    "checklist": [
+        {"text": "Review escalation reason", "required": True},
+        {"text": "Determine appropriate action", "required": True},
+        {"text": "Assign to appropriate person", "required": True}
+    ],
+    "dueInHours": 2
+})
+
 # =============================================
 # Outcome Templates
 # =============================================
 
+# Templates are built once per container and shared; OutcomeTemplateDefinition is frozen
+
+@lru_cache(maxsize=1)
 def create_medication_template() -> OutcomeTemplateDefinition:
     """Create medication verification outcome template"""
     return OutcomeTemplateDefinition(
@@ -96,56 +312,24 @@ def create_medication_template() -> OutcomeTemplateDefinition:
         follow_up_rules=[
             FollowUpRule(
                 outcome_condition="Some doses missed",
-                follow_up_task_template={
-                    "title": "Follow up on missed medication doses",
-                    "description": "Contact elder to understand why doses were missed and reschedule",
-                    "priority": "high",
-                    "estimatedMinutes": 15,
-                    "checklist": [
-                        {"text": "Contact elder about missed doses", "required": True},
-                        {"text": "Understand reason for missing doses", "required": True},
-                        {"text": "Reschedule missed doses if appropriate", "required": True},
-                        {"text": "Document reason in notes", "required": False}
-                    ],
-                    "dueInHours": 4
-                },
+                follow_up_task_template=MEDICATION_MISSED_DOSES_TASK,
                 due_in_hours=4
             ),
             FollowUpRule(
                 outcome_condition="Doses refused",
-                follow_up_task_template={
-                    "title": "Investigate medication refusal",
-                    "description": "Understand why elder is refusing medication and escalate if needed",
-                    "priority": "high",
-                    "estimatedMinutes": 20,
-                    "checklist": [
-                        {"text": "Ask about side effects or concerns", "required": True},
-                        {"text": "Contact primary care physician if needed", "required": True},
-                        {"text": "Document refusal reason", "required": True}
-                    ],
-                    "dueInHours": 2
-                },
+                follow_up_task_template=MEDICATION_REFUSED_TASK,
                 due_in_hours=2
             ),
             FollowUpRule(
                 outcome_condition="Unable to verify",
-                follow_up_task_template={
-                    "title": "Escalate medication verification issue",
-                    "description": "Unable to verify medication status - escalate to primary caregiver",
-                    "priority": "urgent",
-                    "estimatedMinutes": 10,
-                    "checklist": [
-                        {"text": "Contact primary caregiver", "required": True},
-                        {"text": "Provide context about verification issue", "required": True}
-                    ],
-                    "dueInHours": 1
-                },
+                follow_up_task_template=MEDICATION_UNVERIFIED_TASK,
                 due_in_hours=1
             )
         ],
         evidence_types=["photo", "notes", "timestamp"]
     )
 
+@lru_cache(maxsize=1)
 def create_safety_template() -> OutcomeTemplateDefinition:
     """Create safety check outcome template"""
     return OutcomeTemplateDefinition(
@@ -161,57 +345,24 @@ def create_safety_template() -> OutcomeTemplateDefinition:
         follow_up_rules=[
             FollowUpRule(
                 outcome_condition="Minor safety issues found",
-                follow_up_task_template={
-                    "title": "Address minor safety issues",
-                    "description": "Implement solutions for identified minor safety concerns",
-                    "priority": "medium",
-                    "estimatedMinutes": 30,
-                    "checklist": [
-                        {"text": "Identify specific safety issues", "required": True},
-                        {"text": "Implement corrective measures", "required": True},
-                        {"text": "Verify improvements", "required": True}
-                    ],
-                    "dueInHours": 24
-                },
+                follow_up_task_template=SAFETY_MINOR_ISSUES_TASK,
                 due_in_hours=24
             ),
             FollowUpRule(
                 outcome_condition="Major safety concerns identified",
-                follow_up_task_template={
-                    "title": "Address major safety concerns",
-                    "description": "Urgent action needed to address major safety concerns",
-                    "priority": "urgent",
-                    "estimatedMinutes": 60,
-                    "checklist": [
-                        {"text": "Document all safety concerns", "required": True},
-                        {"text": "Contact family members", "required": True},
-                        {"text": "Implement immediate safety measures", "required": True},
-                        {"text": "Consider professional assessment", "required": True}
-                    ],
-                    "dueInHours": 2
-                },
+                follow_up_task_template=SAFETY_MAJOR_CONCERNS_TASK,
                 due_in_hours=2
             ),
             FollowUpRule(
                 outcome_condition="Immediate intervention required",
-                follow_up_task_template={
-                    "title": "Emergency safety intervention",
-                    "description": "Immediate action required for critical safety issue",
-                    "priority": "urgent",
-                    "estimatedMinutes": 15,
-                    "checklist": [
-                        {"text": "Ensure elder safety immediately", "required": True},
-                        {"text": "Contact emergency services if needed", "required": True},
-                        {"text": "Notify all family members", "required": True}
-                    ],
-                    "dueInHours": 0.5
-                },
+                follow_up_task_template=SAFETY_INTERVENTION_TASK,
                 due_in_hours=0.5
             )
         ],
         evidence_types=["photo", "video", "notes", "timestamp"]
     )
 
+@lru_cache(maxsize=1)
 def create_appointment_template() -> OutcomeTemplateDefinition:
     """Create medical appointment outcome template"""
     return OutcomeTemplateDefinition(
@@ -228,56 +379,24 @@ def create_appointment_template() -> OutcomeTemplateDefinition:
         follow_up_rules=[
             FollowUpRule(
                 outcome_condition="Appointment completed successfully",
-                follow_up_task_template={
-                    "title": "Document appointment results",
-                    "description": "Collect and document results from completed appointment",
-                    "priority": "medium",
-                    "estimatedMinutes": 20,
-                    "checklist": [
-                        {"text": "Collect appointment summary from elder", "required": True},
-                        {"text": "Document any new medications or instructions", "required": True},
-                        {"text": "Schedule any recommended follow-ups", "required": True}
-                    ],
-                    "dueInHours": 4
-                },
+                follow_up_task_template=APPOINTMENT_COMPLETED_TASK,
                 due_in_hours=4
             ),
             FollowUpRule(
                 outcome_condition="Appointment rescheduled",
-                follow_up_task_template={
-                    "title": "Confirm rescheduled appointment",
-                    "description": "Confirm new appointment date and time with elder",
-                    "priority": "medium",
-                    "estimatedMinutes": 10,
-                    "checklist": [
-                        {"text": "Confirm new appointment date/time", "required": True},
-                        {"text": "Update calendar", "required": True},
-                        {"text": "Arrange transportation if needed", "required": True}
-                    ],
-                    "dueInHours": 24
-                },
+                follow_up_task_template=APPOINTMENT_RESCHEDULED_TASK,
                 due_in_hours=24
             ),
             FollowUpRule(
                 outcome_condition="Elder refused to attend",
-                follow_up_task_template={
-                    "title": "Follow up on appointment refusal",
-                    "description": "Understand why elder refused appointment and escalate if needed",
-                    "priority": "high",
-                    "estimatedMinutes": 20,
-                    "checklist": [
-                        {"text": "Understand reason for refusal", "required": True},
-                        {"text": "Contact physician if medically necessary", "required": True},
-                        {"text": "Document refusal and reason", "required": True}
-                    ],
-                    "dueInHours": 4
-                },
+                follow_up_task_template=APPOINTMENT_REFUSED_TASK,
                 due_in_hours=4
             )
         ],
         evidence_types=["notes", "documents", "timestamp"]
     )
 
+@lru_cache(maxsize=1)
 def create_general_template() -> OutcomeTemplateDefinition:
     """Create general task outcome template"""
     return OutcomeTemplateDefinition(
@@ -293,50 +412,17 @@ def create_general_template() -> OutcomeTemplateDefinition:
         follow_up_rules=[
             FollowUpRule(
                 outcome_condition="Partially completed",
-                follow_up_task_template={
-                    "title": "Complete remaining task items",
-                    "description": "Complete the remaining items from the original task",
-                    "priority": "medium",
-                    "estimatedMinutes": 30,
-                    "checklist": [
-                        {"text": "Review what was not completed", "required": True},
-                        {"text": "Complete remaining items", "required": True},
-                        {"text": "Verify completion", "required": True}
-                    ],
-                    "dueInHours": 24
-                },
+                follow_up_task_template=GENERAL_PARTIAL_TASK,
                 due_in_hours=24
             ),
             FollowUpRule(
                 outcome_condition="Not completed",
-                follow_up_task_template={
-                    "title": "Retry incomplete task",
-                    "description": "Attempt to complete the task again",
-                    "priority": "high",
-                    "estimatedMinutes": 30,
-                    "checklist": [
-                        {"text": "Understand reason for non-completion", "required": True},
-                        {"text": "Address any barriers", "required": True},
-                        {"text": "Retry task completion", "required": True}
-                    ],
-                    "dueInHours": 12
-                },
+                follow_up_task_template=GENERAL_NOT_COMPLETED_TASK,
                 due_in_hours=12
             ),
             FollowUpRule(
                 outcome_condition="Escalated",
-                follow_up_task_template={
-                    "title": "Handle escalated task",
-                    "description": "Task has been escalated and requires attention",
-                    "priority": "urgent",
-                    "estimatedMinutes": 20,
-                    "checklist": [
-                        {"text": "Review escalation reason", "required": True},
-                        {"text": "Determine appropriate action", "required": True},
-                        {"text": "Assign to appropriate person", "required": True}
-                    ],
-                    "dueInHours": 2
-                },
+                follow_up_task_template=GENERAL_ESCALATED_TASK,
                 due_in_hours=2
             )
         ],
@@ -351,251 +437,233 @@ OUTCOME_TEMPLATES = {
     OutcomeTemplateType.GENERAL: create_general_template
 }
 
+def _freeze_template_summary(template: OutcomeTemplateDefinition) -> Mapping[str, Any]:
+    """Read-only public form of an outcome template, safe to cache"""
+    return MappingProxyType({
+        'templateType': template.template_type.value,
+        'title': template.title,
+        'description': template.description,
+        'outcomeOptions': tuple(template.outcome_options),
+        'evidenceTypes': tuple(template.evidence_types)
+    })
+
+def _thaw_template_summary(summary: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a read-only template summary into a plain, JSON-ready dict"""
+    return {
+        **summary,
+        'outcomeOptions': list(summary['outcomeOptions']),
+        'evidenceTypes': list(summary['evidenceTypes'])
+    }
+
+@lru_cache(maxsize=1)
+def _available_template_summaries() -> Tuple[Mapping[str, Any], ...]:
+    """Read-only public forms of all templates, built once"""
+    return tuple(_freeze_template_summary(template_factory()) for template_factory in OUTCOME_TEMPLATES.values())
+
+@lru_cache(maxsize=32)
+def _frozen_template_summary_by_type(template_type: str) -> Optional[Mapping[str, Any]]:
+    """Read-only public form of a template by type, built once per type"""
+    template = _get_outcome_template(template_type)
+    return _freeze_template_summary(template) if template else None
+
+def _template_summary_by_type(template_type: str) -> Optional[Dict[str, Any]]:
+    """Public dict form of a template by type"""
+    summary = _frozen_template_summary_by_type(template_type)
+    return _thaw_template_summary(summary) if summary else None
+
 # =============================================
 # Outcome Capture Service
 # =============================================
 
-class OutcomeCaptureService:
-    """Backend service for outcome capture and follow-up automation"""
+# Outcomes where notes are recommended during validation
+OUTCOMES_NEEDING_NOTES = frozenset({"Partially completed", "Not completed", "Escalated"})
+
+def _get_outcome_template(template_type: str) -> Optional[OutcomeTemplateDefinition]:
+    """Get outcome template by type"""
+    try:
+        template_enum = OutcomeTemplateType(template_type)
+        template_factory = OUTCOME_TEMPLATES.get(template_enum)
+        if template_factory:
+            return template_factory()
+    except ValueError:
+        pass
+    return None
+
+def _get_available_templates() -> List[Dict[str, Any]]:
+    """Get all available outcome templates"""
+    return [_thaw_template_summary(summary) for summary in _available_template_summaries()]
+
+def _capture_outcome(
+    task_id: str,
+    template_type: str,
+    outcome: str,
+    notes: str,
+    evidence: Optional[List[Dict[str, Any]]] = None
+) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
+    """Capture outcome with validation"""
+    template = _get_outcome_template(template_type)
+    if not template:
+        return False, ["Invalid outcome template type"], None
     
-    @staticmethod
-    def get_outcome_template(template_type: str) -> Optional[OutcomeTemplateDefinition]:
-        """Get outcome template by type"""
-        try:
-            template_enum = OutcomeTemplateType(template_type)
-            template_factory = OUTCOME_TEMPLATES.get(template_enum)
-            if template_factory:
-                return template_factory()
-        except ValueError:
-            pass
-        return None
+    # Validate outcome selection
+    if outcome not in template.outcome_options_set:
+        return False, [f"Invalid outcome: {outcome}"], None
     
-    @staticmethod
-    def get_available_templates() -> List[Dict[str, Any]]:
-        """Get all available outcome templates"""
-        templates = []
-        for template_factory in OUTCOME_TEMPLATES.values():
-            template = template_factory()
-            templates.append({
-                'templateType': template.template_type.value,
-                'title': template.title,
-                'description': template.description,
-                'outcomeOptions': template.outcome_options,
-                'evidenceTypes': template.evidence_types
-            })
-        return templates
+    # One rule lookup drives both follow-up fields
+    rule = template.rules_by_condition.get(outcome)
     
-    @staticmethod
-    def capture_outcome(
-        task_id: str,
-        template_type: str,
-        outcome: str,
-        notes: str,
-        evidence: Optional[List[Dict[str, Any]]] = None
-    ) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
-        """Capture outcome with validation"""
-        template = OutcomeCaptureService.get_outcome_template(template_type)
-        if not template:
-            return False, ["Invalid outcome template type"], None
-        
-        errors = []
-        
-        # Validate outcome selection
-        if outcome not in template.outcome_options:
-            errors.append(f"Invalid outcome: {outcome}")
-        
-        if errors:
-            return False, errors, None
-        
-        captured_outcome = {
-            'actionTaken': outcome,
-            'emergencyServicesCalled': False,
-            'notes': notes,
-            'evidence': evidence or [],
-            'followUpRequired': OutcomeCaptureService._should_generate_follow_up(template, outcome),
-            'nextCheckIn': OutcomeCaptureService._calculate_next_check_in(template, outcome)
-        }
-        
-        logger.info(f"Outcome captured for task {task_id}: {outcome}")
-        return True, [], captured_outcome
+    captured_outcome = {
+        'actionTaken': outcome,
+        'emergencyServicesCalled': False,
+        'notes': notes,
+        'evidence': evidence or [],
+        'followUpRequired': rule is not None,
+        'nextCheckIn': _calculate_next_check_in(rule) if rule else None
+    }
     
-    @staticmethod
-    def generate_follow_up_tasks(
-        template_type: str,
-        outcome: str
-    ) -> List[Dict[str, Any]]:
-        """Generate follow-up tasks based on outcome"""
-        template = OutcomeCaptureService.get_outcome_template(template_type)
-        if not template:
-            return []
-        
-        follow_up_tasks = []
-        
-        for rule in template.follow_up_rules:
-            if OutcomeCaptureService._evaluate_outcome_condition(rule.outcome_condition, outcome):
-                follow_up_tasks.append(rule.follow_up_task_template)
-                logger.info(f"Generated follow-up task for outcome: {outcome}")
-        
-        return follow_up_tasks
+    _get_logger().info(f"Outcome captured for task {task_id}: {outcome}")
+    return True, [], captured_outcome
+
+def _check_outcome_requires_follow_up(template_type: str, outcome: str) -> Tuple[bool, Optional[str]]:
+    """Get follow-up required and next check-in for an outcome without capturing it"""
+    template = _get_outcome_template(template_type)
+    rule = template.rules_by_condition.get(outcome) if template else None
+    if not rule:
+        return False, None
+    return True, _calculate_next_check_in(rule)
+
+def _generate_follow_up_tasks(
+    template_type: str,
+    outcome: str
+) -> List[Dict[str, Any]]:
+    """Generate follow-up tasks based on outcome"""
+    template = _get_outcome_template(template_type)
+    if not template:
+        return []
     
-    @staticmethod
-    def create_timeline_entry(
-        family_id: str,
-        elder_id: str,
-        task_id: str,
-        outcome: Dict[str, Any],
-        template_type: str,
-        caregiver: Dict[str, str]
-    ) -> Dict[str, Any]:
-        """Create immutable timeline entry for outcome"""
-        now = datetime.utcnow().isoformat() + 'Z'
-        timeline_id = f"TIMELINE#{task_id}#{uuid.uuid4().hex[:8]}"
-        
-        timeline_entry = {
-            'id': timeline_id,
-            'familyId': family_id,
-            'elderId': elder_id,
-            'timestamp': now,
-            'eventType': 'outcome_captured',
-            'title': f"Task Outcome: {template_type}",
-            'description': outcome.get('notes', outcome.get('actionTaken', '')),
-            'details': {
-                'taskId': task_id,
-                'templateType': template_type,
-                'outcome': outcome.get('actionTaken'),
-                'notes': outcome.get('notes'),
-                'evidence': outcome.get('evidence', []),
-                'followUpRequired': outcome.get('followUpRequired', False)
-            },
-            'caregiver': caregiver,
-            'immutable': True,
-            'createdAt': now,
-            'updatedAt': now
-        }
-        
-        logger.info(f"Created timeline entry: {timeline_id}")
-        return timeline_entry
+    rule = template.rules_by_condition.get(outcome)
+    if not rule:
+        return []
     
-    @staticmethod
-    def validate_outcome_completeness(
-        template_type: str,
-        outcome: str,
-        notes: str
-    ) -> Tuple[bool, List[str]]:
-        """Validate outcome completeness"""
-        template = OutcomeCaptureService.get_outcome_template(template_type)
-        if not template:
-            return False, ["Invalid template type"]
-        
-        missing_fields = []
-        
-        if not outcome or outcome not in template.outcome_options:
-            missing_fields.append("Outcome selection")
-        
-        # Notes are optional but recommended for certain outcomes
-        if not notes and outcome in ["Partially completed", "Not completed", "Escalated"]:
-            missing_fields.append("Notes (recommended for this outcome)")
-        
-        return len(missing_fields) == 0, missing_fields
+    _get_logger().info(f"Generated follow-up task for outcome: {outcome}")
+    return [_thaw_task(rule.follow_up_task_template)]
+
+def _create_timeline_entry(
+    family_id: str,
+    elder_id: str,
+    task_id: str,
+    outcome: Dict[str, Any],
+    template_type: str,
+    caregiver: Dict[str, str],
+    now: Optional[str] = None
+) -> Dict[str, Any]:
+    """Create immutable timeline entry for outcome"""
+    now = now or _utcnow_iso()
+    timeline_id = f"TIMELINE#{task_id}#{_acquire_id_suffix()}"
     
-    @staticmethod
-    def get_evidence_requirements(template_type: str) -> List[str]:
-        """Get evidence requirements for template"""
-        template = OutcomeCaptureService.get_outcome_template(template_type)
-        return template.evidence_types if template else []
+    timeline_entry = {
+        'id': timeline_id,
+        'familyId': family_id,
+        'elderId': elder_id,
+        'timestamp': now,
+        'eventType': 'outcome_captured',
+        'title': f"Task Outcome: {template_type}",
+        'description': outcome.get('notes', outcome.get('actionTaken', '')),
+        'details': {
+            'taskId': task_id,
+            'templateType': template_type,
+            'outcome': outcome.get('actionTaken'),
+            'notes': outcome.get('notes'),
+            'evidence': outcome.get('evidence', []),
+            'followUpRequired': outcome.get('followUpRequired', False)
+        },
+        'caregiver': caregiver,
+        'immutable': True,
+        'createdAt': now,
+        'updatedAt': now
+    }
     
-    @staticmethod
-    def to_dynamodb_item(
-        family_id: str,
-        outcome_data: Dict[str, Any],
-        task_id: str
-    ) -> Dict[str, Any]:
-        """Convert outcome to DynamoDB item format"""
-        now = datetime.utcnow().isoformat() + 'Z'
-        outcome_id = f"OUTCOME#{task_id}#{uuid.uuid4().hex[:8]}"
-        
-        return {
-            'PK': f'FAMILY#{family_id}',
-            'SK': outcome_id,
-            'GSI1PK': f'TASK#{task_id}',
-            'GSI1SK': now,
-            'outcome_id': outcome_id,
-            'task_id': task_id,
-            'action_taken': outcome_data.get('actionTaken'),
-            'notes': outcome_data.get('notes'),
-            'evidence': outcome_data.get('evidence', []),
-            'follow_up_required': outcome_data.get('followUpRequired', False),
-            'next_check_in': outcome_data.get('nextCheckIn'),
-            'created_at': now,
-            'updated_at': now,
-            'entity_type': 'outcome'
-        }
+    _get_logger().info(f"Created timeline entry: {timeline_id}")
+    return timeline_entry
+
+def _validate_outcome_completeness(
+    template_type: str,
+    outcome: str,
+    notes: str
+) -> Tuple[bool, List[str]]:
+    """Validate outcome completeness"""
+    template = _get_outcome_template(template_type)
+    if not template:
+        return False, ["Invalid template type"]
     
-    # =============================================
-    # Private Helper Methods
-    # =============================================
+    missing_fields = []
     
-    @staticmethod
-    def _should_generate_follow_up(template: OutcomeTemplateDefinition, outcome: str) -> bool:
-        """Check if follow-up should be generated"""
-        return any(
-            OutcomeCaptureService._evaluate_outcome_condition(rule.outcome_condition, outcome)
-            for rule in template.follow_up_rules
-        )
+    if not outcome or outcome not in template.outcome_options_set:
+        missing_fields.append("Outcome selection")
     
-    @staticmethod
-    def _calculate_next_check_in(template: OutcomeTemplateDefinition, outcome: str) -> Optional[str]:
-        """Calculate next check-in time"""
-        for rule in template.follow_up_rules:
-            if OutcomeCaptureService._evaluate_outcome_condition(rule.outcome_condition, outcome):
-                next_check_in = datetime.utcnow() + timedelta(hours=rule.due_in_hours)
-                return next_check_in.isoformat() + 'Z'
-        return None
+    # Notes are optional but recommended for certain outcomes
+    if not notes and outcome in OUTCOMES_NEEDING_NOTES:
+        missing_fields.append("Notes (recommended for this outcome)")
     
-    @staticmethod
-    def _evaluate_outcome_condition(condition: str, outcome: str) -> bool:
-        """Evaluate outcome condition"""
-        return condition == outcome
+    return len(missing_fields) == 0, missing_fields
 
-# =============================================
-# Utility Functions
-# =============================================
+def _get_evidence_requirements(template_type: str) -> List[str]:
+    """Get evidence requirements for template"""
+    template = _get_outcome_template(template_type)
+    return list(template.evidence_types) if template else []
 
-def get_outcome_template(template_type: str) -> Optional[Dict[str, Any]]:
-    """Get outcome template by type"""
-    template = OutcomeCaptureService.get_outcome_template(template_type)
-    if not template:
-        return None
+def _to_dynamodb_item(
+    family_id: str,
+    outcome_data: Dict[str, Any],
+    task_id: str,
+    now: Optional[str] = None
+) -> Dict[str, Any]:
+    """Convert outcome to DynamoDB item format"""
+    now = now or _utcnow_iso()
+    outcome_id = f"OUTCOME#{task_id}#{_acquire_id_suffix()}"
     
     return {
-        'templateType': template.template_type.value,
-        'title': template.title,
-        'description': template.description,
-        'outcomeOptions': template.outcome_options,
-        'evidenceTypes': template.evidence_types
+        'PK': f'FAMILY#{family_id}',
+        'SK': outcome_id,
+        'GSI1PK': f'TASK#{task_id}',
+        'GSI1SK': now,
+        'outcome_id': outcome_id,
+        'task_id': task_id,
+        'action_taken': outcome_data.get('actionTaken'),
+        'notes': outcome_data.get('notes'),
+        'evidence': outcome_data.get('evidence', []),
+        'follow_up_required': outcome_data.get('followUpRequired', False),
+        'next_check_in': outcome_data.get('nextCheckIn'),
+        'created_at': now,
+        'updated_at': now,
+        'entity_type': 'outcome'
     }
 
-def capture_outcome(
-    task_id: str,
-    template_type: str,
-    outcome: str,
-    notes: str,
-    evidence: Optional[List[Dict[str, Any]]] = None
-) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
-    """Capture outcome with validation"""
-    return OutcomeCaptureService.capture_outcome(task_id, template_type, outcome, notes, evidence)
+def _calculate_next_check_in(rule: FollowUpRule) -> str:
+    """Calculate next check-in time for a follow-up rule"""
+    next_check_in = datetime.now(timezone.utc) + timedelta(hours=rule.due_in_hours)
+    return next_check_in.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
 
-def generate_follow_up_tasks(template_type: str, outcome: str) -> List[Dict[str, Any]]:
-    """Generate follow-up tasks"""
-    return OutcomeCaptureService.generate_follow_up_tasks(template_type, outcome)
+class OutcomeCaptureService:
+    """Backend service for outcome capture and follow-up automation (delegates to module functions)"""
+    
+    get_outcome_template = staticmethod(_get_outcome_template)
+    get_available_templates = staticmethod(_get_available_templates)
+    capture_outcome = staticmethod(_capture_outcome)
+    check_outcome_requires_follow_up = staticmethod(_check_outcome_requires_follow_up)
+    generate_follow_up_tasks = staticmethod(_generate_follow_up_tasks)
+    create_timeline_entry = staticmethod(_create_timeline_entry)
+    validate_outcome_completeness = staticmethod(_validate_outcome_completeness)
+    get_evidence_requirements = staticmethod(_get_evidence_requirements)
+    to_dynamodb_item = staticmethod(_to_dynamodb_item)
 
-def create_timeline_entry(
-    family_id: str,
-    elder_id: str,
-    task_id: str,
-    outcome: Dict[str, Any],
-    template_type: str,
-    caregiver: Dict[str, str]
-) -> Dict[str, Any]:
-    """Create timeline entry"""
-    return OutcomeCaptureService.create_timeline_entry(family_id, elder_id, task_id, outcome, template_type, caregiver)
+# =============================================
+# Utility Functions
+# =============================================
+
+# Public entry points bound directly to the implementations (no pass-through frame)
+get_outcome_template = _template_summary_by_type
+capture_outcome = _capture_outcome
+check_outcome_requires_follow_up = _check_outcome_requires_follow_up
+generate_follow_up_tasks = _generate_follow_up_tasks
+create_timeline_entry = _create_timeline_entry
@@ -3,16 +3,24 @@ Triage Protocol State Machine - Backend Implementation
 Implements 4-step workflow: Safety Check → Assessment → Action Plan → Outcome Capture
 """
 
-import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union, Tuple
-from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Callable, Dict, Any, FrozenSet, List, Mapping, NamedTuple, Optional, Union, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
-import uuid
+from functools import lru_cache
+from types import MappingProxyType
+import time
+import secrets
 
-from aws_lambda_powertools import Logger
+_logger = None
 
-logger = Logger()
+def _get_logger():
+    """Create the Powertools logger on first use, keeping it off the import path"""
+    global _logger
+    if _logger is None:
+        from aws_lambda_powertools import Logger
+        _logger = Logger()
+    return _logger
 
 # =============================================
 # Enums and Data Classes
@@ -24,6 +32,15 @@ class ProtocolType(Enum):
     CHEST_PAIN = "chest_pain"
     CONFUSION = "confusion"
 
+PROTOCOL_TYPE_BY_VALUE = {protocol_type.value: protocol_type for protocol_type in ProtocolType}
+
+def _protocol_type_from_value(value: str) -> ProtocolType:
+    """Resolve a ProtocolType by value, raising ValueError like the Enum constructor"""
+    protocol_type = PROTOCOL_TYPE_BY_VALUE.get(value)
+    if protocol_type is None:
+        raise ValueError(f"{value!r} is not a valid ProtocolType")
+    return protocol_type
+
 class QuestionType(Enum):
     YES_NO = "yes_no"
     SCALE = "scale"
@@ -36,34 +53,69 @@ class ActionRecommendation(Enum):
     NURSE_LINE = "nurse_line"
     MONITOR = "monitor"
 
-@dataclass
-class TriageQuestion:
+class TriageQuestion(NamedTuple):
     id: str
     text: str
     type: QuestionType
     required: bool
     critical_flag: bool = False
-    options: Optional[List[str]] = None
+    options: Optional[Tuple[str, ...]] = None
 
-@dataclass
-class StepTransition:
+class StepTransition(NamedTuple):
     condition: str
     next_step: Union[int, str]  # int for step number, 'emergency' or 'complete'
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TriageStep:
     step_number: int
     title: str
-    questions: List[TriageQuestion]
-    critical_flags: List[str]
-    next_step_logic: List[StepTransition]
+    questions: Tuple[TriageQuestion, ...]
+    critical_flags: Tuple[str, ...]
+    next_step_logic: Tuple[StepTransition, ...]
+    conditional_transitions: Tuple[Tuple[Callable[[Dict[str, Any]], bool], StepTransition], ...] = field(init=False, repr=False, compare=False)
+    default_transition: Optional[StepTransition] = field(init=False, repr=False, compare=False)
+    compiled_flags: Tuple[Tuple[str, Callable[[Dict[str, Any]], bool]], ...] = field(init=False, repr=False, compare=False)
+    question_dicts: Tuple[Mapping[str, Any], ...] = field(init=False, repr=False, compare=False)
+    transition_dicts: Tuple[Mapping[str, Any], ...] = field(init=False, repr=False, compare=False)
+    required_questions: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    required_question_ids: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # (id, text) of required questions in order, plus the id set for missing-answer checks
+        required = tuple((q.id, q.text) for q in self.questions if q.required)
+        object.__setattr__(self, 'required_questions', required)
+        object.__setattr__(self, 'required_question_ids', frozenset(question_id for question_id, _ in required))
+        
+        # Questions and transitions never change, so serialize them once (read-only; steps are shared)
+        object.__setattr__(self, 'question_dicts', tuple(MappingProxyType(_question_to_dict(q)) for q in self.questions))
+        object.__setattr__(self, 'transition_dicts', tuple(MappingProxyType(_transition_to_dict(t)) for t in self.next_step_logic))
+        object.__setattr__(self, 'compiled_flags', tuple((flag, compile_condition(flag)) for flag in self.critical_flags))
+        
+        # Compile transitions up front; DEFAULT always matches, so it ends the scan and becomes the fallback
+        conditional = []
+        default = None
+        for transition in self.next_step_logic:
+            if transition.condition == "DEFAULT":
+                default = transition
+                break
+            conditional.append((compile_condition(transition.condition), transition))
+        object.__setattr__(self, 'conditional_transitions', tuple(conditional))
+        object.__setattr__(self, 'default_transition', default)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TriageProtocolTemplate:
     protocol_type: ProtocolType
-    steps: List[TriageStep]
+    steps: Tuple[TriageStep, ...]
+    steps_by_number: Dict[int, TriageStep] = field(init=False, repr=False, compare=False)
+    required_questions: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    required_question_ids: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'steps_by_number', {step.step_number: step for step in self.steps})
+        object.__setattr__(self, 'required_questions', tuple(q for step in self.steps for q in step.required_questions))
+        object.__setattr__(self, 'required_question_ids', frozenset().union(*(step.required_question_ids for step in self.steps)))
 
-@dataclass
+@dataclass(slots=True)
 class ActionPlan:
     recommendation: ActionRecommendation
     call_script: str
@@ -71,7 +123,7 @@ class ActionPlan:
     estimated_timeframe: str
     follow_up_tasks: List[Dict[str, Any]]
 
-@dataclass
+@dataclass(slots=True)
 class TriageOutcome:
     action_taken: str
     emergency_services_called: bool
@@ -80,19 +132,146 @@ class TriageOutcome:
     follow_up_required: bool
     next_check_in: Optional[str] = None
 
+# =============================================
+# Condition Compilation
+# =============================================
+
+ConditionPredicate = Callable[[Dict[str, Any]], bool]
+
+# Accepted spellings for yes/no answers
+YES_RESPONSES = frozenset((True, "yes", "Yes"))
+NO_RESPONSES = frozenset((False, "no", "No"))
+
+def _always(responses: Dict[str, Any]) -> bool:
+    return True
+
+def _never(responses: Dict[str, Any]) -> bool:
+    return False
+
+@lru_cache(maxsize=128)
+def compile_condition(condition: str) -> ConditionPredicate:
+    """Parse a transition or critical-flag condition once into a predicate over responses"""
+    if condition == "DEFAULT":
+        return _always
+    
+    # Handle OR conditions
+    if " OR " in condition:
+        or_predicates = tuple(_compile_single_condition(cond.strip()) for cond in condition.split(" OR "))
+        return lambda responses: any(predicate(responses) for predicate in or_predicates)
+    
+    # Handle AND conditions
+    if " AND " in condition:
+        and_predicates = tuple(_compile_single_condition(cond.strip()) for cond in condition.split(" AND "))
+        return lambda responses: all(predicate(responses) for predicate in and_predicates)
+    
+    # Single condition
+    return _compile_single_condition(condition)
+
+def _compile_single_condition(condition: str) -> ConditionPredicate:
+    """Compile a single condition with no OR/AND"""
+    # Handle comparison operators
+    if ">=" in condition:
+        question_id, value = condition.split(">=")
+        question_id = question_id.strip()
+        threshold = float(value.strip())
+        def at_least(responses: Dict[str, Any]) -> bool:
+            response = responses.get(question_id)
+            return response is not None and float(response) >= threshold
+        return at_least
+    
+    if "<=" in condition:
+        question_id, value = condition.split("<=")
+        question_id = question_id.strip()
+        threshold = float(value.strip())
+        def at_most(responses: Dict[str, Any]) -> bool:
+            response = responses.get(question_id)
+            return response is not None and float(response) <= threshold
+        return at_most
+    
+    # Handle exact matches (question_id_expected_value)
+    parts = condition.split("_")
+    if len(parts) < 3:
+        return _never
+    
+    question_id = "_".join(parts[:-1])
+    expected_value = parts[-1]
+    
+    if expected_value == "yes":
+        return lambda responses: responses.get(question_id) in YES_RESPONSES
+    if expected_value == "no":
+        return lambda responses: responses.get(question_id) in NO_RESPONSES
+    if expected_value.endswith("plus"):
+        # Handle cases like "8_plus"
+        try:
+            plus_threshold = float(expected_value.replace("_plus", ""))
+        except ValueError:
+            return _never
+        def plus(responses: Dict[str, Any]) -> bool:
+            response = responses.get(question_id)
+            try:
+                return response is not None and float(response) >= plus_threshold
+            except (ValueError, TypeError):
+                return False
+        return plus
+    
+    return lambda responses: str(responses.get(question_id)) == expected_value
+
+# =============================================
+# Template Serialization
+# =============================================
+
+def _question_to_dict(question: TriageQuestion) -> Dict[str, Any]:
+    """Convert question to dictionary"""
+    return {
+        'id': question.id,
+        'text': question.text,
+        'type': question.type.value,
+        'required': question.required,
+        'criticalFlag': question.critical_flag,
+        'options': question.options
+    }
+
+def _transition_to_dict(transition: StepTransition) -> Dict[str, Any]:
+    """Convert transition to dictionary"""
+    return {
+        'condition': transition.condition,
+        'nextStep': transition.next_step
+    }
+
+def _thaw_dicts(dicts: Tuple[Mapping[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Copy read-only serialized questions or transitions into plain, JSON-ready dicts"""
+    return [dict(item) for item in dicts]
+
 # =============================================
 # Protocol Templates
 # =============================================
 
-def create_fall_protocol() -> TriageProtocolTemplate:
+# Shared by several protocols so the registry holds a single instance of each
+ACTION_TAKEN_QUESTION = TriageQuestion(
+    id="action_taken",
+    text="Action taken:",
+    type=QuestionType.TEXT,
+    required=True
+)
+
+EMERGENCY_CALLED_QUESTION = TriageQuestion(
+    id="emergency_called",
+    text="Were emergency services called?",
+    type=QuestionType.YES_NO,
+    required=True
+)
+
+COMPLETE_TRANSITION = StepTransition(condition="DEFAULT", next_step="complete")
+
+def _create_fall_protocol() -> TriageProtocolTemplate:
     """Create fall protocol template"""
     return TriageProtocolTemplate(
         protocol_type=ProtocolType.FALL,
-        steps=[
+        steps=(
             TriageStep(
                 step_number=1,
                 title="Immediate Safety Check",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="consciousness",
                         text="Is the elder conscious and breathing normally?",
@@ -114,9 +293,9 @@ def create_fall_protocol() -> TriageProtocolTemplate:
                         required=True,
                         critical_flag=False
                     )
-                ],
-                critical_flags=["consciousness_no", "severe_injury_yes", "pain_level_initial_8_plus"],
-                next_step_logic=[
+                ),
+                critical_flags=("consciousness_no", "severe_injury_yes", "pain_level_initial_8_plus"),
+                next_step_logic=(
                     StepTransition(
                         condition="consciousness_no OR severe_injury_yes OR pain_level_initial >= 8",
                         next_step="emergency"
@@ -125,17 +304,17 @@ def create_fall_protocol() -> TriageProtocolTemplate:
                         condition="consciousness_yes AND severe_injury_no AND pain_level_initial < 8",
                         next_step=2
                     )
-                ]
+                )
             ),
             TriageStep(
                 step_number=2,
                 title="Rapid Assessment",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="pain_location",
                         text="Where is the pain located?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Head/Neck", "Back/Spine", "Hip/Pelvis", "Arm/Shoulder", "Leg/Knee", "Other"],
+                        options=("Head/Neck", "Back/Spine", "Hip/Pelvis", "Arm/Shoulder", "Leg/Knee", "Other"),
                         required=True
                     ),
                     TriageQuestion(
@@ -164,9 +343,9 @@ def create_fall_protocol() -> TriageProtocolTemplate:
                         required=True,
                         critical_flag=True
                     )
-                ],
-                critical_flags=["head_injury_check_yes", "confusion_check_yes"],
-                next_step_logic=[
+                ),
+                critical_flags=("head_injury_check_yes", "confusion_check_yes"),
+                next_step_logic=(
                     StepTransition(
                         condition="head_injury_check_yes OR confusion_check_yes",
                         next_step="emergency"
@@ -179,65 +358,60 @@ def create_fall_protocol() -> TriageProtocolTemplate:
                         condition="DEFAULT",
                         next_step=3
                     )
-                ]
+                )
             ),
             TriageStep(
                 step_number=3,
                 title="Action Plan Generation",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="action_preference",
                         text="Based on the assessment, what action would you prefer?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Call 911", "Go to Urgent Care", "Call Nurse Line", "Monitor at Home"],
+                        options=("Call 911", "Go to Urgent Care", "Call Nurse Line", "Monitor at Home"),
                         required=True
-                    )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step=4)
-                ]
+                    ),
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    StepTransition(condition="DEFAULT", next_step=4),
+                )
             ),
             TriageStep(
                 step_number=4,
                 title="Outcome Capture",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="action_taken",
                         text="What action was taken?",
                         type=QuestionType.TEXT,
                         required=True
                     ),
-                    TriageQuestion(
-                        id="emergency_called",
-                        text="Were emergency services called?",
-                        type=QuestionType.YES_NO,
-                        required=True
-                    ),
+                    EMERGENCY_CALLED_QUESTION,
                     TriageQuestion(
                         id="outcome_notes",
                         text="Additional notes about the outcome:",
                         type=QuestionType.TEXT,
                         required=False
                     )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step="complete")
-                ]
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    COMPLETE_TRANSITION,
+                )
             )
-        ]
+        )
     )
 
-def create_injury_protocol() -> TriageProtocolTemplate:
+def _create_injury_protocol() -> TriageProtocolTemplate:
     """Create injury protocol template"""
     return TriageProtocolTemplate(
         protocol_type=ProtocolType.INJURY,
-        steps=[
+        steps=(
             TriageStep(
                 step_number=1,
                 title="Immediate Safety Check",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="consciousness",
                         text="Is the elder conscious and alert?",
@@ -249,7 +423,7 @@ def create_injury_protocol() -> TriageProtocolTemplate:
                         id="bleeding_severity",
                         text="Is there active bleeding?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["No bleeding", "Minor bleeding", "Moderate bleeding", "Severe bleeding"],
+                        options=("No bleeding", "Minor bleeding", "Moderate bleeding", "Severe bleeding"),
                         required=True,
                         critical_flag=True
                     ),
@@ -260,25 +434,25 @@ def create_injury_protocol() -> TriageProtocolTemplate:
                         required=True,
                         critical_flag=True
                     )
-                ],
-                critical_flags=["consciousness_no", "bleeding_severity_severe", "breathing_status_no"],
-                next_step_logic=[
+                ),
+                critical_flags=("consciousness_no", "bleeding_severity_severe", "breathing_status_no"),
+                next_step_logic=(
                     StepTransition(
                         condition="consciousness_no OR bleeding_severity_severe OR breathing_status_no",
                         next_step="emergency"
                     ),
                     StepTransition(condition="DEFAULT", next_step=2)
-                ]
+                )
             ),
             TriageStep(
                 step_number=2,
                 title="Rapid Assessment",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="injury_location",
                         text="Where is the injury located?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Head/Face", "Neck", "Chest", "Abdomen", "Arms", "Legs", "Back"],
+                        options=("Head/Face", "Neck", "Chest", "Abdomen", "Arms", "Legs", "Back"),
                         required=True
                     ),
                     TriageQuestion(
@@ -299,43 +473,38 @@ def create_injury_protocol() -> TriageProtocolTemplate:
                         type=QuestionType.YES_NO,
                         required=True
                     )
-                ],
-                critical_flags=["pain_scale_8_plus"],
-                next_step_logic=[
+                ),
+                critical_flags=("pain_scale_8_plus",),
+                next_step_logic=(
                     StepTransition(
                         condition="pain_scale >= 8",
                         next_step="emergency"
                     ),
                     StepTransition(condition="DEFAULT", next_step=3)
-                ]
+                )
             ),
             TriageStep(
                 step_number=3,
                 title="Action Plan Generation",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="recommended_action",
                         text="Recommended next step:",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Emergency Room", "Urgent Care", "Primary Care", "Home Care"],
+                        options=("Emergency Room", "Urgent Care", "Primary Care", "Home Care"),
                         required=True
-                    )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step=4)
-                ]
+                    ),
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    StepTransition(condition="DEFAULT", next_step=4),
+                )
             ),
             TriageStep(
                 step_number=4,
                 title="Outcome Capture",
-                questions=[
-                    TriageQuestion(
-                        id="action_taken",
-                        text="Action taken:",
-                        type=QuestionType.TEXT,
-                        required=True
-                    ),
+                questions=(
+                    ACTION_TAKEN_QUESTION,
                     TriageQuestion(
                         id="emergency_called",
                         text="Were emergency services contacted?",
@@ -348,24 +517,24 @@ def create_injury_protocol() -> TriageProtocolTemplate:
                         type=QuestionType.YES_NO,
                         required=True
                     )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step="complete")
-                ]
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    COMPLETE_TRANSITION,
+                )
             )
-        ]
+        )
     )
 
-def create_chest_pain_protocol() -> TriageProtocolTemplate:
+def _create_chest_pain_protocol() -> TriageProtocolTemplate:
     """Create chest pain protocol template"""
     return TriageProtocolTemplate(
         protocol_type=ProtocolType.CHEST_PAIN,
-        steps=[
+        steps=(
             TriageStep(
                 step_number=1,
                 title="Immediate Safety Check",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="consciousness",
                         text="Is the elder conscious and responsive?",
@@ -394,25 +563,25 @@ def create_chest_pain_protocol() -> TriageProtocolTemplate:
                         required=True,
                         critical_flag=True
                     )
-                ],
-                critical_flags=["consciousness_no", "chest_pain_severity_7_plus", "breathing_difficulty_yes", "sweating_nausea_yes"],
-                next_step_logic=[
+                ),
+                critical_flags=("consciousness_no", "chest_pain_severity_7_plus", "breathing_difficulty_yes", "sweating_nausea_yes"),
+                next_step_logic=(
                     StepTransition(
                         condition="consciousness_no OR chest_pain_severity >= 7 OR breathing_difficulty_yes OR sweating_nausea_yes",
                         next_step="emergency"
                     ),
                     StepTransition(condition="DEFAULT", next_step=2)
-                ]
+                )
             ),
             TriageStep(
                 step_number=2,
                 title="Rapid Assessment",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="pain_duration",
                         text="How long has the chest pain been present?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Less than 5 minutes", "5-15 minutes", "15-30 minutes", "More than 30 minutes"],
+                        options=("Less than 5 minutes", "5-15 minutes", "15-30 minutes", "More than 30 minutes"),
                         required=True
                     ),
                     TriageQuestion(
@@ -434,73 +603,63 @@ def create_chest_pain_protocol() -> TriageProtocolTemplate:
                         type=QuestionType.YES_NO,
                         required=True
                     )
-                ],
-                critical_flags=["pain_radiation_yes"],
-                next_step_logic=[
+                ),
+                critical_flags=("pain_radiation_yes",),
+                next_step_logic=(
                     StepTransition(
                         condition="pain_radiation_yes OR pain_duration_more_than_30",
                         next_step="emergency"
                     ),
                     StepTransition(condition="DEFAULT", next_step=3)
-                ]
+                )
             ),
             TriageStep(
                 step_number=3,
                 title="Action Plan Generation",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="immediate_action",
                         text="Immediate action required:",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Call 911 Immediately", "Go to Emergency Room", "Call Cardiologist", "Monitor Closely"],
+                        options=("Call 911 Immediately", "Go to Emergency Room", "Call Cardiologist", "Monitor Closely"),
                         required=True
-                    )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step=4)
-                ]
+                    ),
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    StepTransition(condition="DEFAULT", next_step=4),
+                )
             ),
             TriageStep(
                 step_number=4,
                 title="Outcome Capture",
-                questions=[
-                    TriageQuestion(
-                        id="action_taken",
-                        text="Action taken:",
-                        type=QuestionType.TEXT,
-                        required=True
-                    ),
-                    TriageQuestion(
-                        id="emergency_called",
-                        text="Were emergency services called?",
-                        type=QuestionType.YES_NO,
-                        required=True
-                    ),
+                questions=(
+                    ACTION_TAKEN_QUESTION,
+                    EMERGENCY_CALLED_QUESTION,
                     TriageQuestion(
                         id="symptoms_resolved",
                         text="Have symptoms improved or resolved?",
                         type=QuestionType.YES_NO,
                         required=True
                     )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step="complete")
-                ]
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    COMPLETE_TRANSITION,
+                )
             )
-        ]
+        )
     )
 
-def create_confusion_protocol() -> TriageProtocolTemplate:
+def _create_confusion_protocol() -> TriageProtocolTemplate:
     """Create confusion protocol template"""
     return TriageProtocolTemplate(
         protocol_type=ProtocolType.CONFUSION,
-        steps=[
+        steps=(
             TriageStep(
                 step_number=1,
                 title="Immediate Safety Check",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="responsiveness",
                         text="Is the elder responsive to voice and touch?",
@@ -512,7 +671,7 @@ def create_confusion_protocol() -> TriageProtocolTemplate:
                         id="orientation_check",
                         text="Does the elder know their name, location, and date?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Knows all three", "Knows two", "Knows one", "Knows none"],
+                        options=("Knows all three", "Knows two", "Knows one", "Knows none"),
                         required=True,
                         critical_flag=True
                     ),
@@ -523,25 +682,25 @@ def create_confusion_protocol() -> TriageProtocolTemplate:
                         required=True,
                         critical_flag=True
                     )
-                ],
-                critical_flags=["responsiveness_no", "orientation_check_knows_none", "physical_symptoms_yes"],
-                next_step_logic=[
+                ),
+                critical_flags=("responsiveness_no", "orientation_check_knows_none", "physical_symptoms_yes"),
+                next_step_logic=(
                     StepTransition(
                         condition="responsiveness_no OR orientation_check_knows_none OR physical_symptoms_yes",
                         next_step="emergency"
                     ),
                     StepTransition(condition="DEFAULT", next_step=2)
-                ]
+                )
             ),
             TriageStep(
                 step_number=2,
                 title="Rapid Assessment",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="confusion_onset",
                         text="When did the confusion start?",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Suddenly (minutes)", "Gradually (hours)", "Over days", "Chronic/ongoing"],
+                        options=("Suddenly (minutes)", "Gradually (hours)", "Over days", "Chronic/ongoing"),
                         required=True
                     ),
                     TriageQuestion(
@@ -563,71 +722,219 @@ def create_confusion_protocol() -> TriageProtocolTemplate:
                         required=True,
                         critical_flag=True
                     )
-                ],
-                critical_flags=["safety_concerns_yes"],
-                next_step_logic=[
+                ),
+                critical_flags=("safety_concerns_yes",),
+                next_step_logic=(
                     StepTransition(
                         condition="safety_concerns_yes OR confusion_onset_suddenly",
                         next_step="emergency"
                     ),
                     StepTransition(condition="DEFAULT", next_step=3)
-                ]
+                )
             ),
             TriageStep(
                 step_number=3,
                 title="Action Plan Generation",
-                questions=[
+                questions=(
                     TriageQuestion(
                         id="recommended_care",
                         text="Recommended level of care:",
                         type=QuestionType.MULTIPLE_CHOICE,
-                        options=["Emergency Room", "Urgent Care", "Primary Care Same Day", "Schedule Appointment"],
+                        options=("Emergency Room", "Urgent Care", "Primary Care Same Day", "Schedule Appointment"),
                         required=True
-                    )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step=4)
-                ]
+                    ),
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    StepTransition(condition="DEFAULT", next_step=4),
+                )
             ),
             TriageStep(
                 step_number=4,
                 title="Outcome Capture",
-                questions=[
-                    TriageQuestion(
-                        id="action_taken",
-                        text="Action taken:",
-                        type=QuestionType.TEXT,
-                        required=True
-                    ),
-                    TriageQuestion(
-                        id="emergency_called",
-                        text="Were emergency services called?",
-                        type=QuestionType.YES_NO,
-                        required=True
-                    ),
+                questions=(
+                    ACTION_TAKEN_QUESTION,
+                    EMERGENCY_CALLED_QUESTION,
                     TriageQuestion(
                         id="safety_measures",
                         text="What safety measures were implemented?",
                         type=QuestionType.TEXT,
                         required=False
                     )
-                ],
-                critical_flags=[],
-                next_step_logic=[
-                    StepTransition(condition="DEFAULT", next_step="complete")
-                ]
+                ),
+                critical_flags=(),
+                next_step_logic=(
+                    COMPLETE_TRANSITION,
+                )
             )
-        ]
+        )
     )
 
-# Protocol Templates Registry
-PROTOCOL_TEMPLATES = {
-    ProtocolType.FALL: create_fall_protocol,
-    ProtocolType.INJURY: create_injury_protocol,
-    ProtocolType.CHEST_PAIN: create_chest_pain_protocol,
-    ProtocolType.CONFUSION: create_confusion_protocol
-}
+# Protocol Templates Registry (built once at import; templates are frozen and shared)
+PROTOCOL_TEMPLATES: Mapping[ProtocolType, TriageProtocolTemplate] = MappingProxyType({
+    ProtocolType.FALL: _create_fall_protocol(),
+    ProtocolType.INJURY: _create_injury_protocol(),
+    ProtocolType.CHEST_PAIN: _create_chest_pain_protocol(),
+    ProtocolType.CONFUSION: _create_confusion_protocol()
+})
+
+# =============================================
+# Action Plan Templates
+# =============================================
+
+def _freeze_plan(plan: Dict[str, Any]) -> Mapping[str, Any]:
+    """Make an action plan template read-only"""
+    return MappingProxyType({
+        **plan,
+        'followUpTasks': tuple(
+            MappingProxyType({**task, 'checklist': tuple(MappingProxyType(item) for item in task['checklist'])})
+            for task in plan['followUpTasks']
+        )
+    })
+
+def _thaw_plan(plan: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a read-only action plan template into plain, JSON-ready dicts"""
+    return {
+        **plan,
+        'followUpTasks': [
+            {**task, 'checklist': [dict(item) for item in task['checklist']]}
+            for task in plan['followUpTasks']
+        ]
+    }
+
+EMERGENCY_CALL_SCRIPTS = MappingProxyType({
+    ProtocolType.FALL: "This is a medical emergency. An elderly person has fallen and may have serious injuries. Please send an ambulance immediately.",
+    ProtocolType.INJURY: "This is a medical emergency. An elderly person has sustained a serious injury. Please send an ambulance immediately.",
+    ProtocolType.CHEST_PAIN: "This is a medical emergency. An elderly person is experiencing severe chest pain. This may be a heart attack. Please send an ambulance immediately.",
+    ProtocolType.CONFUSION: "This is a medical emergency. An elderly person is experiencing severe confusion or altered mental state. Please send an ambulance immediately."
+})
+
+DEFAULT_EMERGENCY_CALL_SCRIPT = "This is a medical emergency. Please send an ambulance immediately."
+
+# callScript is filled in per protocol from EMERGENCY_CALL_SCRIPTS
+EMERGENCY_ACTION_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.CALL_911.value,
+    'callScript': DEFAULT_EMERGENCY_CALL_SCRIPT,
+    'urgencyLevel': 10,
+    'estimatedTimeframe': 'Immediate',
+    'followUpTasks': [
+        {
+            'title': 'Follow up on emergency response',
+            'description': 'Contact family members and track emergency services response',
+            'priority': 'urgent',
+            'estimatedMinutes': 15,
+            'checklist': [
+                {'text': 'Confirm ambulance arrival', 'required': True},
+                {'text': 'Notify primary family contacts', 'required': True},
+                {'text': 'Gather medical information for hospital', 'required': True}
+            ],
+            'dueInHours': 1
+        }
+    ]
+})
+
+FALL_URGENT_CARE_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.URGENT_CARE.value,
+    'callScript': 'The elder has fallen and is experiencing significant pain or mobility issues. Please arrange for urgent medical evaluation.',
+    'urgencyLevel': 7,
+    'estimatedTimeframe': 'Within 2 hours',
+    'followUpTasks': [
+        {
+            'title': 'Arrange urgent care visit',
+            'description': 'Schedule and transport to urgent care facility',
+            'priority': 'high',
+            'estimatedMinutes': 60,
+            'checklist': [
+                {'text': 'Call urgent care to confirm availability', 'required': True},
+                {'text': 'Arrange transportation', 'required': True},
+                {'text': 'Gather insurance and medication information', 'required': True}
+            ],
+            'dueInHours': 2
+        }
+    ]
+})
+
+FALL_MONITOR_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.MONITOR.value,
+    'callScript': 'The elder appears stable after the fall. Continue monitoring for any changes in condition.',
+    'urgencyLevel': 4,
+    'estimatedTimeframe': 'Monitor for 24 hours',
+    'followUpTasks': [
+        {
+            'title': 'Monitor post-fall condition',
+            'description': 'Check on elder regularly for next 24 hours',
+            'priority': 'medium',
+            'estimatedMinutes': 10,
+            'checklist': [
+                {'text': 'Check pain level every 4 hours', 'required': True},
+                {'text': 'Monitor mobility and balance', 'required': True},
+                {'text': 'Watch for signs of delayed injury', 'required': True}
+            ],
+            'dueInHours': 4
+        }
+    ]
+})
+
+INJURY_URGENT_CARE_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.URGENT_CARE.value,
+    'callScript': 'The elder has sustained an injury requiring medical attention. Please arrange for urgent care evaluation.',
+    'urgencyLevel': 6,
+    'estimatedTimeframe': 'Within 4 hours',
+    'followUpTasks': []
+})
+
+INJURY_MONITOR_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.MONITOR.value,
+    'callScript': 'The injury appears minor. Continue monitoring and provide basic first aid as needed.',
+    'urgencyLevel': 3,
+    'estimatedTimeframe': 'Monitor closely',
+    'followUpTasks': []
+})
+
+CHEST_PAIN_URGENT_CARE_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.URGENT_CARE.value,
+    'callScript': 'The elder is experiencing chest pain. Given the potential cardiac implications, please arrange for immediate medical evaluation.',
+    'urgencyLevel': 8,
+    'estimatedTimeframe': 'Within 1 hour',
+    'followUpTasks': [
+        {
+            'title': 'Urgent cardiac evaluation',
+            'description': 'Ensure immediate medical assessment for chest pain',
+            'priority': 'urgent',
+            'estimatedMinutes': 30,
+            'checklist': [
+                {'text': 'Contact primary care physician', 'required': True},
+                {'text': 'Prepare cardiac medication list', 'required': True},
+                {'text': 'Monitor vital signs if possible', 'required': True}
+            ],
+            'dueInHours': 1
+        }
+    ]
+})
+
+CONFUSION_URGENT_CARE_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.URGENT_CARE.value,
+    'callScript': 'The elder is experiencing confusion that may require immediate medical evaluation to rule out serious causes.',
+    'urgencyLevel': 7,
+    'estimatedTimeframe': 'Within 2 hours',
+    'followUpTasks': []
+})
+
+CONFUSION_NURSE_LINE_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.NURSE_LINE.value,
+    'callScript': 'The elder is experiencing confusion. Please contact the nurse line or primary care provider for guidance.',
+    'urgencyLevel': 5,
+    'estimatedTimeframe': 'Within 4 hours',
+    'followUpTasks': []
+})
+
+DEFAULT_ACTION_PLAN = _freeze_plan({
+    'recommendation': ActionRecommendation.MONITOR.value,
+    'callScript': 'Continue monitoring the situation and contact healthcare provider if symptoms worsen.',
+    'urgencyLevel': 3,
+    'estimatedTimeframe': 'Within 24 hours',
+    'followUpTasks': []
+})
 
 # =============================================
 # Triage Protocol State Machine
@@ -638,32 +945,51 @@ class TriageProtocolStateMachine:
     
     def __init__(self, alert_id: str, protocol_type: str):
         self.alert_id = alert_id
-        self.protocol_type = ProtocolType(protocol_type)
-        self.template = PROTOCOL_TEMPLATES[self.protocol_type]()
+        self.protocol_type = _protocol_type_from_value(protocol_type)
+        self.template = PROTOCOL_TEMPLATES[self.protocol_type]
         self.current_step_number = 1
         self.responses: Dict[str, Any] = {}
         self.created_at = datetime.utcnow().isoformat() + 'Z'
-        self.updated_at = self.created_at
+        self._updated_ts: Optional[float] = None
+        self._updated_at: Optional[str] = self.created_at
+        self._current_step_cache: Optional[Mapping[str, Any]] = None
+        
+    @property
+    def updated_at(self) -> str:
+        """Timestamp of the last change, formatted on first read"""
+        if self._updated_at is None:
+            self._updated_at = datetime.utcfromtimestamp(self._updated_ts).isoformat() + 'Z'
+        return self._updated_at
         
     def get_current_step(self) -> Dict[str, Any]:
         """Get the current step information"""
-        current_step = self._find_step_by_number(self.current_step_number)
-        if not current_step:
-            raise ValueError(f"Step {self.current_step_number} not found")
+        # The step view only depends on the step number, so reuse it until the step changes
+        cached = self._current_step_cache
+        if cached is None or cached['stepNumber'] != self.current_step_number:
+            current_step = self._find_step_by_number(self.current_step_number)
+            if not current_step:
+                raise ValueError(f"Step {self.current_step_number} not found")
+            
+            cached = self._current_step_cache = MappingProxyType({
+                'stepNumber': current_step.step_number,
+                'title': current_step.title,
+                'questions': current_step.question_dicts,
+                'criticalFlags': current_step.critical_flags,
+                'nextStepLogic': current_step.transition_dicts
+            })
         
+        # Callers may edit the response, so hand out a copy of the read-only view
         return {
-            'stepNumber': current_step.step_number,
-            'title': current_step.title,
-            'questions': [self._question_to_dict(q) for q in current_step.questions],
-            'criticalFlags': current_step.critical_flags,
-            'nextStepLogic': [self._transition_to_dict(t) for t in current_step.next_step_logic]
+            **cached,
+            'questions': _thaw_dicts(cached['questions']),
+            'nextStepLogic': _thaw_dicts(cached['nextStepLogic'])
         }
     
     def record_response(self, question_id: str, response: Any) -> None:
         """Record a response to a question"""
         self.responses[question_id] = response
-        self.updated_at = datetime.utcnow().isoformat() + 'Z'
-        logger.info(f"Recorded response for {question_id}: {response}")
+        self._touch()
+        _get_logger().info(f"Recorded response for {question_id}: {response}")
     
     def has_critical_flags(self) -> bool:
         """Check if current step has critical flags triggered"""
@@ -671,9 +997,9 @@ class TriageProtocolStateMachine:
         if not current_step:
             return False
         
-        for flag in current_step.critical_flags:
-            if self._evaluate_condition(flag):
-                logger.warning(f"Critical flag triggered: {flag}")
+        for flag, predicate in current_step.compiled_flags:
+            if predicate(self.responses):
+                _get_logger().warning(f"Critical flag triggered: {flag}")
                 return True
         
         return False
@@ -685,17 +1011,19 @@ class TriageProtocolStateMachine:
             return "complete"
         
         # Evaluate step transition logic
-        for transition in current_step.next_step_logic:
-            if self._evaluate_condition(transition.condition):
-                logger.info(f"Transition condition met: {transition.condition} -> {transition.next_step}")
+        for predicate, transition in current_step.conditional_transitions:
+            if predicate(self.responses):
+                _get_logger().info(f"Transition condition met: {transition.condition} -> {transition.next_step}")
                 return transition.next_step
         
+        transition = current_step.default_transition
+        if transition is not None:
+            _get_logger().info(f"Transition condition met: {transition.condition} -> {transition.next_step}")
+            return transition.next_step
+        
         # Default: go to next sequential step
         next_step_number = self.current_step_number + 1
-        if self._find_step_by_number(next_step_number):
-            return next_step_number
-        
-        return "complete"
+        return next_step_number if next_step_number in self.template.steps_by_number else "complete"
     
     def proceed_to_next_step(self) -> Union[Dict[str, Any], str]:
         """Proceed to the next step"""
@@ -706,7 +1034,7 @@ class TriageProtocolStateMachine:
         
         if isinstance(next_step, int):
             self.current_step_number = next_step
-            self.updated_at = datetime.utcnow().isoformat() + 'Z'
+            self._touch()
             return self.get_current_step()
         
         return "complete"
@@ -726,12 +1054,12 @@ class TriageProtocolStateMachine:
         if not current_step:
             return False, ["Invalid step"]
         
-        missing_questions = []
-        for question in current_step.questions:
-            if question.required and question.id not in self.responses:
-                missing_questions.append(question.text)
+        missing_ids = current_step.required_question_ids.difference(self.responses)
+        if not missing_ids:
+            return True, []
         
-        return len(missing_questions) == 0, missing_questions
+        missing_questions = [text for question_id, text in current_step.required_questions if question_id in missing_ids]
+        return False, missing_questions
     
     def get_protocol_state(self) -> Dict[str, Any]:
         """Get the complete protocol state"""
@@ -746,7 +1074,7 @@ class TriageProtocolStateMachine:
     
     def to_dynamodb_item(self, family_id: str) -> Dict[str, Any]:
         """Convert to DynamoDB item format"""
-        protocol_id = f"PROTOCOL#{self.alert_id}#{uuid.uuid4().hex[:8]}"
+        protocol_id = f"PROTOCOL#{self.alert_id}#{secrets.token_hex(4)}"
         
         return {
             'PK': f'FAMILY#{family_id}',
@@ -767,131 +1095,25 @@ class TriageProtocolStateMachine:
     # Private Helper Methods
     # =============================================
     
+    def _touch(self) -> None:
+        """Record a change; the ISO string is only built when updated_at is read"""
+        self._updated_ts = time.time()
+        self._updated_at = None
+    
     def _find_step_by_number(self, step_number: int) -> Optional[TriageStep]:
         """Find step by step number"""
-        for step in self.template.steps:
-            if step.step_number == step_number:
-                return step
-        return None
-    
-    def _question_to_dict(self, question: TriageQuestion) -> Dict[str, Any]:
-        """Convert question to dictionary"""
-        return {
-            'id': question.id,
-            'text': question.text,
-            'type': question.type.value,
-            'required': question.required,
-            'criticalFlag': question.critical_flag,
-            'options': question.options
-        }
-    
-    def _transition_to_dict(self, transition: StepTransition) -> Dict[str, Any]:
-        """Convert transition to dictionary"""
-        return {
-            'condition': transition.condition,
-            'nextStep': transition.next_step
-        }
-    
-    def _evaluate_condition(self, condition: str) -> bool:
-        """Evaluate a condition string against current responses"""
-        if condition == "DEFAULT":
-            return True
-        
-        # Handle OR conditions
-        if " OR " in condition:
-            or_conditions = condition.split(" OR ")
-            return any(self._evaluate_single_condition(cond.strip()) for cond in or_conditions)
-        
-        # Handle AND conditions
-        if " AND " in condition:
-            and_conditions = condition.split(" AND ")
-            return all(self._evaluate_single_condition(cond.strip()) for cond in and_conditions)
-        
-        # Single condition
-        return self._evaluate_single_condition(condition)
-    
-    def _evaluate_single_condition(self, condition: str) -> bool:
-        """Evaluate a single condition"""
-        # Handle comparison operators
-        if ">=" in condition:
-            question_id, value = condition.split(">=")
-            question_id = question_id.strip()
-            value = value.strip()
-            response = self.responses.get(question_id)
-            return response is not None and float(response) >= float(value)
-        
-        if "<=" in condition:
-            question_id, value = condition.split("<=")
-            question_id = question_id.strip()
-            value = value.strip()
-            response = self.responses.get(question_id)
-            return response is not None and float(response) <= float(value)
-        
-        # Handle exact matches (question_id_expected_value)
-        parts = condition.split("_")
-        if len(parts) >= 3:
-            question_id = "_".join(parts[:-1])
-            expected_value = parts[-1]
-            response = self.responses.get(question_id)
-            
-            if expected_value == "yes":
-                return response in [True, "yes", "Yes"]
-            if expected_value == "no":
-                return response in [False, "no", "No"]
-            if expected_value.endswith("plus"):
-                # Handle cases like "8_plus"
-                threshold = expected_value.replace("_plus", "")
-                try:
-                    return response is not None and float(response) >= float(threshold)
-                except (ValueError, TypeError):
-                    return False
-            
-            return str(response) == expected_value
-        
-        return False
+        return self.template.steps_by_number.get(step_number)
     
     def _generate_emergency_action_plan(self) -> Dict[str, Any]:
         """Generate emergency action plan"""
-        call_scripts = {
-            ProtocolType.FALL: "This is a medical emergency. An elderly person has fallen and may have serious injuries. Please send an ambulance immediately.",
-            ProtocolType.INJURY: "This is a medical emergency. An elderly person has sustained a serious injury. Please send an ambulance immediately.",
-            ProtocolType.CHEST_PAIN: "This is a medical emergency. An elderly person is experiencing severe chest pain. This may be a heart attack. Please send an ambulance immediately.",
-            ProtocolType.CONFUSION: "This is a medical emergency. An elderly person is experiencing severe confusion or altered mental state. Please send an ambulance immediately."
-        }
-        
-        return {
-            'recommendation': ActionRecommendation.CALL_911.value,
-            'callScript': call_scripts.get(self.protocol_type, "This is a medical emergency. Please send an ambulance immediately."),
-            'urgencyLevel': 10,
-            'estimatedTimeframe': 'Immediate',
-            'followUpTasks': [
-                {
-                    'title': 'Follow up on emergency response',
-                    'description': 'Contact family members and track emergency services response',
-                    'priority': 'urgent',
-                    'estimatedMinutes': 15,
-                    'checklist': [
-                        {'text': 'Confirm ambulance arrival', 'required': True},
-                        {'text': 'Notify primary family contacts', 'required': True},
-                        {'text': 'Gather medical information for hospital', 'required': True}
-                    ],
-                    'dueInHours': 1
-                }
-            ]
-        }
+        plan = _thaw_plan(EMERGENCY_ACTION_PLAN)
+        plan['callScript'] = EMERGENCY_CALL_SCRIPTS.get(self.protocol_type, DEFAULT_EMERGENCY_CALL_SCRIPT)
+        return plan
     
     def _generate_protocol_specific_action_plan(self) -> Dict[str, Any]:
         """Generate protocol-specific action plan based on responses"""
-        if self.protocol_type == ProtocolType.FALL:
-            return self._generate_fall_action_plan()
-        elif self.protocol_type == ProtocolType.INJURY:
-            return self._generate_injury_action_plan()
-        elif self.protocol_type == ProtocolType.CHEST_PAIN:
-            return self._generate_chest_pain_action_plan()
-        elif self.protocol_type == ProtocolType.CONFUSION:
-            return self._generate_confusion_action_plan()
-        else:
-            return self._generate_default_action_plan()
+        generator = self._ACTION_PLAN_GENERATORS.get(self.protocol_type, TriageProtocolStateMachine._generate_default_action_plan)
+        return generator(self)
     
     def _generate_fall_action_plan(self) -> Dict[str, Any]:
         """Generate fall-specific action plan"""
@@ -903,48 +1125,10 @@ class TriageProtocolStateMachine:
         except (ValueError, TypeError):
             pain_level = 0
         
-        if pain_level >= 6 or can_move in [False, "no", "No"]:
-            return {
-                'recommendation': ActionRecommendation.URGENT_CARE.value,
-                'callScript': 'The elder has fallen and is experiencing significant pain or mobility issues. Please arrange for urgent medical evaluation.',
-                'urgencyLevel': 7,
-                'estimatedTimeframe': 'Within 2 hours',
-                'followUpTasks': [
-                    {
-                        'title': 'Arrange urgent care visit',
-                        'description': 'Schedule and transport to urgent care facility',
-                        'priority': 'high',
-                        'estimatedMinutes': 60,
-                        'checklist': [
-                            {'text': 'Call urgent care to confirm availability', 'required': True},
-                            {'text': 'Arrange transportation', 'required': True},
-                            {'text': 'Gather insurance and medication information', 'required': True}
-                        ],
-                        'dueInHours': 2
-                    }
-                ]
-            }
+        if pain_level >= 6 or can_move in NO_RESPONSES:
+            return _thaw_plan(FALL_URGENT_CARE_PLAN)
         
-        return {
-            'recommendation': ActionRecommendation.MONITOR.value,
-            'callScript': 'The elder appears stable after the fall. Continue monitoring for any changes in condition.',
-            'urgencyLevel': 4,
-            'estimatedTimeframe': 'Monitor for 24 hours',
-            'followUpTasks': [
-                {
-                    'title': 'Monitor post-fall condition',
-                    'description': 'Check on elder regularly for next 24 hours',
-                    'priority': 'medium',
-                    'estimatedMinutes': 10,
-                    'checklist': [
-                        {'text': 'Check pain level every 4 hours', 'required': True},
-                        {'text': 'Monitor mobility and balance', 'required': True},
-                        {'text': 'Watch for signs of delayed injury', 'required': True}
-                    ],
-                    'dueInHours': 4
-                }
-            ]
-        }
+        return _thaw_plan(FALL_MONITOR_PLAN)
     
     def _generate_injury_action_plan(self) -> Dict[str, Any]:
         """Generate injury-specific action plan"""
@@ -957,77 +1141,36 @@ class TriageProtocolStateMachine:
             pain_level = 0
         
         if pain_level >= 7 or bleeding_severity == 'Moderate bleeding':
-            return {
-                'recommendation': ActionRecommendation.URGENT_CARE.value,
-                'callScript': 'The elder has sustained an injury requiring medical attention. Please arrange for urgent care evaluation.',
-                'urgencyLevel': 6,
-                'estimatedTimeframe': 'Within 4 hours',
-                'followUpTasks': []
-            }
+            return _thaw_plan(INJURY_URGENT_CARE_PLAN)
         
-        return {
-            'recommendation': ActionRecommendation.MONITOR.value,
-            'callScript': 'The injury appears minor. Continue monitoring and provide basic first aid as needed.',
-            'urgencyLevel': 3,
-            'estimatedTimeframe': 'Monitor closely',
-            'followUpTasks': []
-        }
+        return _thaw_plan(INJURY_MONITOR_PLAN)
     
     def _generate_chest_pain_action_plan(self) -> Dict[str, Any]:
         """Generate chest pain-specific action plan"""
         # Chest pain should generally be treated seriously
-        return {
-            'recommendation': ActionRecommendation.URGENT_CARE.value,
-            'callScript': 'The elder is experiencing chest pain. Given the potential cardiac implications, please arrange for immediate medical evaluation.',
-            'urgencyLevel': 8,
-            'estimatedTimeframe': 'Within 1 hour',
-            'followUpTasks': [
-                {
-                    'title': 'Urgent cardiac evaluation',
-                    'description': 'Ensure immediate medical assessment for chest pain',
-                    'priority': 'urgent',
-                    'estimatedMinutes': 30,
-                    'checklist': [
-                        {'text': 'Contact primary care physician', 'required': True},
-                        {'text': 'Prepare cardiac medication list', 'required': True},
-                        {'text': 'Monitor vital signs if possible', 'required': True}
-                    ],
-                    'dueInHours': 1
-                }
-            ]
-        }
+        return _thaw_plan(CHEST_PAIN_URGENT_CARE_PLAN)
     
     def _generate_confusion_action_plan(self) -> Dict[str, Any]:
         """Generate confusion-specific action plan"""
         onset_type = self.responses.get('confusion_onset')
         medication_changes = self.responses.get('medication_changes')
         
-        if onset_type == 'Suddenly (minutes)' or medication_changes in [True, "yes", "Yes"]:
-            return {
-                'recommendation': ActionRecommendation.URGENT_CARE.value,
-                'callScript': 'The elder is experiencing confusion that may require immediate medical evaluation to rule out serious causes.',
-                'urgencyLevel': 7,
-                'estimatedTimeframe': 'Within 2 hours',
-                'followUpTasks': []
-            }
+        if onset_type == 'Suddenly (minutes)' or medication_changes in YES_RESPONSES:
+            return _thaw_plan(CONFUSION_URGENT_CARE_PLAN)
         
-        return {
-            'recommendation': ActionRecommendation.NURSE_LINE.value,
-            'callScript': 'The elder is experiencing confusion. Please contact the nurse line or primary care provider for guidance.',
-            'urgencyLevel': 5,
-            'estimatedTimeframe': 'Within 4 hours',
-            'followUpTasks': []
-        }
+        return _thaw_plan(CONFUSION_NURSE_LINE_PLAN)
     
     def _generate_default_action_plan(self) -> Dict[str, Any]:
         """Generate default action plan"""
-        return {
-            'recommendation': ActionRecommendation.MONITOR.value,
-            'callScript': 'Continue monitoring the situation and contact healthcare provider if symptoms worsen.',
-            'urgencyLevel': 3,
-            'estimatedTimeframe': 'Within 24 hours',
-            'followUpTasks': []
-        }
+        return _thaw_plan(DEFAULT_ACTION_PLAN)
+    
+    # Built once at class definition; generators are plain functions called with self
+    _ACTION_PLAN_GENERATORS = {
+        ProtocolType.FALL: _generate_fall_action_plan,
+        ProtocolType.INJURY: _generate_injury_action_plan,
+        ProtocolType.CHEST_PAIN: _generate_chest_pain_action_plan,
+        ProtocolType.CONFUSION: _generate_confusion_action_plan
+    }
 
 # =============================================
 # Utility Functions
@@ -1044,31 +1187,17 @@ def get_available_protocol_types() -> List[str]:
 def get_protocol_template(protocol_type: str) -> Optional[Dict[str, Any]]:
     """Get protocol template by type"""
     try:
-        pt = ProtocolType(protocol_type)
-        template = PROTOCOL_TEMPLATES[pt]()
+        pt = _protocol_type_from_value(protocol_type)
+        template = PROTOCOL_TEMPLATES[pt]
         return {
             'protocolType': template.protocol_type.value,
             'steps': [
                 {
                     'stepNumber': step.step_number,
                     'title': step.title,
-                    'questions': [
-                        {
-                            'id': q.id,
-                            'text': q.text,
-                            'type': q.type.value,
-                            'required': q.required,
-                            'criticalFlag': q.critical_flag,
-                            'options': q.options
-                        } for q in step.questions
-                    ],
+                    'questions': _thaw_dicts(step.question_dicts),
                     'criticalFlags': step.critical_flags,
-                    'nextStepLogic': [
-                        {
-                            'condition': t.condition,
-                            'nextStep': t.next_step
-                        } for t in step.next_step_logic
-                    ]
+                    'nextStepLogic': _thaw_dicts(step.transition_dicts)
                 } for step in template.steps
             ]
         }
@@ -1078,17 +1207,19 @@ def get_protocol_template(protocol_type: str) -> Optional[Dict[str, Any]]:
 def validate_protocol_responses(protocol_type: str, responses: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Validate protocol responses for completeness"""
     try:
-        pt = ProtocolType(protocol_type)
-        template = PROTOCOL_TEMPLATES[pt]()
-        
-        errors = []
+        pt = _protocol_type_from_value(protocol_type)
+        template = PROTOCOL_TEMPLATES[pt]
         
         # Check that all required questions across all steps have responses
-        for step in template.steps:
-            for question in step.questions:
-                if question.required and question.id not in responses:
-                    errors.append(f"Missing required response for: {question.text}")
+        missing_ids = template.required_question_ids.difference(responses)
+        if not missing_ids:
+            return True, []
         
-        return len(errors) == 0, errors
+        errors = [
+            f"Missing required response for: {text}"
+            for question_id, text in template.required_questions
+            if question_id in missing_ids
+        ]
+        return False, errors
     except ValueError:
         return False, ["Invalid protocol type"]
\ No newline at end of file
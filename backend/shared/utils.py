@@ -1,32 +1,57 @@
 """
 Shared utilities for CareCircle backend
 """
-import json
 import os
+import zlib
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
-import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 
 logger = Logger()
 tracer = Tracer()
 
-# AWS Clients
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'CareCircle-Data'))
+# AWS Clients (created on first use so importing utils stays cheap on cold start)
+@lru_cache(maxsize=1)
+def get_dynamodb():
+    """Get the shared DynamoDB resource"""
+    import boto3
+    return boto3.resource('dynamodb')
+
+
+@lru_cache(maxsize=1)
+def get_table():
+    """Get the CareCircle DynamoDB table"""
+    return get_dynamodb().Table(os.environ.get('DYNAMODB_TABLE', 'CareCircle-Data'))
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `utils.dynamodb` / `utils.table` working for existing callers
+    if name == 'dynamodb':
+        return get_dynamodb()
+    if name == 'table':
+        return get_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+RESPONSE_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+}
+
+# Send datetimes and dataclasses through default=str, as json.dumps did, and allow non-str keys
+_DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
 
 
 def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Create standardized API Gateway response"""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type,Authorization',
-            'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-        },
-        'body': json.dumps(body, default=str),
+        'headers': dict(RESPONSE_HEADERS),
+        'body': orjson.dumps(body, default=str, option=_DUMPS_OPTIONS).decode(),
     }
 
 
@@ -56,22 +81,24 @@ def calculate_distance(zip1: str, zip2: str) -> float:
     # For demo purposes, return a random distance
     # In production, integrate with a ZIP code distance calculation service
     try:
-        # Simple hash-based pseudo-distance for demo
-        hash_val = abs(hash(zip1 + zip2))
+        # Simple hash-based pseudo-distance for demo; CRC32 is stable across processes, unlike hash()
+        hash_val = zlib.crc32(zip2.encode(), zlib.crc32(zip1.encode()))
         return (hash_val % 100) / 10.0  # Returns 0-10 miles
     except Exception:
         return 5.0  # Default distance
 
 
+LANGUAGE_NAMES = {
+    'en': 'English',
+    'es': 'Spanish',
+    'hi': 'Hindi',
+    'ar': 'Arabic',
+    'zh': 'Mandarin',
+    'pt': 'Portuguese',
+}
+
+
 def get_language_name(code: str) -> str:
     """Convert language code to full name"""
-    languages = {
-        'en': 'English',
-        'es': 'Spanish',
-        'hi': 'Hindi',
-        'ar': 'Arabic',
-        'zh': 'Mandarin',
-        'pt': 'Portuguese',
-    }
-    return languages.get(code, 'English')
+    return LANGUAGE_NAMES.get(code, 'English')
 